@@ -1,2 +1,67 @@
-from .model import *
-from .exceptions import *
\ No newline at end of file
+# Google module
+#
+# The public names of the submodules are loaded lazily (PEP 562): the heavy
+# Google API dependencies are imported only when e.g. `GoogleDrive`, `Gmail`
+# or `GoogleSheet` is first touched, not by `import Google`.
+#
+# N.B: `from Google import *` touches every name and therefore loads everything;
+# import the names you need explicitly to benefit from the lazy loading.
+#
+
+import importlib
+
+from .exceptions import *
+
+# public name -> submodule defining it
+_LAZY_NAMES = {
+    'EmailMessage': 'model',
+    'TRANSIENT_HTTP_STATUSES': 'model',
+    'RateLimiter': 'model',
+    'RequestExecutor': 'model',
+    'GoogleClientRegistry': 'model',
+    'GoogleClient': 'model',
+    'GoogleServiceAccountClient': 'model',
+    'execute_batch': 'model',
+    'GoogleDrive': 'model',
+    'GmailMessage': 'model',
+    'Gmail': 'model',
+    'GoogleSheetClient': 'model',
+    'GoogleSheet': 'model',
+    'Worksheet': 'model',
+    'BufferedWorksheet': 'model',
+    'DriveIndex': 'drive_index',
+    'SheetCache': 'sheet_cache',
+    'GmailStore': 'gmail_store',
+}
+
+__all__ = [
+    'GoogleSheetError',
+    'SpreadsheetNotFound',
+    'WorksheetNotFound',
+    'CellNotFound',
+    'CacheMiss',
+    'GoogleAPIError',
+    'TransientError',
+    'RateLimitExceeded',
+    'BadRequest',
+    'AuthenticationError',
+    'PermissionDenied',
+    'NotFound',
+    'WorkerServiceError',
+    'GoogleDriveError',
+    'ChecksumMismatch',
+] + list(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        module = importlib.import_module(f".{_LAZY_NAMES[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value # later lookups skip `__getattr__`
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
@@ -0,0 +1,151 @@
+# Benchmarks for the Google module
+#
+# Author: Indrajit Ghosh
+#
+# Date: Oct 17, 2026
+#
+# Run from the repository root:
+#     python -m Google.benchmark
+#
+
+import base64
+import subprocess
+import sys
+import timeit
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+# What `import Google` used to cost: every heavy dependency was imported eagerly
+EAGER_IMPORTS = (
+    "import Google.model, bs4, google_auth_oauthlib.flow, "
+    "google.oauth2.service_account, google.auth.transport.requests"
+)
+
+IMPORT_CASES = {
+    'nothing (baseline)': "pass",
+    'import Google (lazy)': "import Google",
+    'Sheets classes (as in main.py)': "from Google import GoogleSheetClient, GoogleSheet",
+    'GoogleDrive': "from Google import GoogleDrive",
+    'eager (previous behaviour)': EAGER_IMPORTS,
+}
+
+
+def time_import(statement:str, repeat:int=5):
+    """
+    Returns the best wall-clock time (in seconds) of running `statement`
+    in a fresh interpreter, out of `repeat` runs.
+    """
+    code = (
+        "import time; _t = time.perf_counter(); "
+        f"{statement}; "
+        "print(time.perf_counter() - _t)"
+    )
+
+    timings = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=REPO_DIR,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        timings.append(float(out.strip().splitlines()[-1]))
+
+    return min(timings)
+
+
+def import_benchmark(repeat:int=5):
+    """
+    Prints the import time of the `Google` package for the cases in `IMPORT_CASES`.
+    """
+    print(f"\nImport time (best of {repeat} fresh interpreters)\n")
+
+    for label, statement in IMPORT_CASES.items():
+        seconds = time_import(statement, repeat=repeat)
+        print(f"  {label:<40} {seconds * 1000:8.1f} ms")
+
+    print()
+
+
+def _b64(text:str):
+    return base64.urlsafe_b64encode(text.encode()).decode().rstrip('=')
+
+
+def mime_corpus(n:int=300):
+    """
+    A synthetic corpus of `n` Gmail `messages().get` payloads shaped like the
+    registration mails: multipart/alternative (text + html), nested
+    multipart/mixed with an attachment, and single part html messages.
+    """
+    plain = "Dear participant,\n\nThank you for registering for the ISI Symposium 2025.\n" * 20
+    html = "<html><body>" + "<p>Thank you for registering for the <b>ISI Symposium 2025</b>.</p>" * 20 + "</body></html>"
+
+    def text_part(mimetype, text):
+        return {
+            'mimeType': mimetype,
+            'filename': '',
+            'headers': [{'name': 'Content-Type', 'value': f'{mimetype}; charset="UTF-8"'}],
+            'body': {'size': len(text), 'data': _b64(text)},
+        }
+
+    alternative = {'mimeType': 'multipart/alternative', 'parts': [text_part('text/plain', plain), text_part('text/html', html)]}
+    mixed = {
+        'mimeType': 'multipart/mixed',
+        'parts': [
+            alternative,
+            {'mimeType': 'application/pdf', 'filename': 'abstract.pdf', 'body': {'attachmentId': 'ANGjdJ8', 'size': 48213}},
+        ]
+    }
+    single_html = text_part('text/html', html)
+
+    shapes = [alternative, mixed, single_html]
+    return [shapes[i % len(shapes)] for i in range(n)]
+
+
+def legacy_extract_body(payload:dict):
+    """The body decoding of `Gmail.get_email_message` before the MIME walker"""
+    from bs4 import BeautifulSoup
+
+    parts = payload.get('parts')[0]
+    data = parts['body']['data']
+    data = data.replace("-","+").replace("_","/")
+    decoded_data = base64.b64decode(data + '=' * (-len(data) % 4))
+    soup = BeautifulSoup(decoded_data , "lxml")
+    return soup.body()
+
+
+def mime_benchmark(n:int=300, repeat:int=5):
+    """
+    Prints the time of extracting the bodies of the `mime_corpus(n)` payloads,
+    with the MIME walker (`Gmail.extract_body`) and with the previous decoding.
+    """
+    from Google import Gmail
+
+    corpus = mime_corpus(n)
+    # The previous decoding fails on single part and nested multipart messages; it is timed on the rest
+    legacy_corpus = [p for p in corpus if 'data' in p.get('parts', [{}])[0].get('body', {})]
+
+    cases = {
+        'Gmail.extract_body, whole corpus': (Gmail.extract_body, corpus),
+        'Gmail.extract_body, same as previous': (Gmail.extract_body, legacy_corpus),
+        'previous parts[0] + BeautifulSoup': (legacy_extract_body, legacy_corpus),
+    }
+
+    print(f"\nMessage body extraction (best of {repeat})\n")
+
+    for label, (extract, payloads) in cases.items():
+        seconds = min(timeit.repeat(lambda: [extract(p) for p in payloads], number=1, repeat=repeat))
+        print(f"  {label:<40} {seconds / len(payloads) * 1e6:8.1f} us/message  ({len(payloads)} messages)")
+
+    print()
+
+
+def main():
+    import_benchmark()
+    mime_benchmark()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+# Local metadata index for Google Drive
+#
+# Author: Indrajit Ghosh
+#
+# Date: Oct 17, 2026
+#
+
+import json
+from pathlib import Path
+
+from .sqlite_store import SQLiteStore
+
+__all__ = ['DriveIndex']
+
+
+class DriveIndex(SQLiteStore):
+    """
+    An on-disk (SQLite) index of Google Drive file metadata.
+
+    The index is filled once by a full crawl of the drive and is then kept
+    current through the Drive `changes().list` token, so that name -> id and
+    id -> metadata lookups do not need any network round trip.
+
+    Parameters:
+    -----------
+        `drive`: `GoogleDrive`; the drive whose files are indexed. Any object
+                with `service` and `executor` attributes and an `iter_files()` method works
+                (see `testing.check_drive_index()`, which runs it on a fake Drive service).
+        `path`: optional; location of the SQLite database file.
+                Use ':memory:' for a throw away index.
+
+    Example:
+    --------
+        >>> index = DriveIndex(drive=GoogleDrive())
+        >>> index.sync()   # full crawl on the first run, incremental afterwards
+        >>> index.get_file_id('indrajit_abstract.tex')
+            '1ftoucUbxz10c1zoU1mDuqMr2NMIxhmbi'
+    """
+
+    DEFAULT_PATH = Path(__file__).resolve().parent / '.cache' / 'drive_index.sqlite3'
+    FIELDS = "id, name, mimeType, parents, modifiedTime, trashed"
+    FOLDER_MIMETYPE = 'application/vnd.google-apps.folder'
+    TABLE = 'files'
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS files (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            mimeType TEXT,
+            parents TEXT,
+            modifiedTime TEXT
+        );
+        CREATE INDEX IF NOT EXISTS files_name ON files (name);
+        CREATE TABLE IF NOT EXISTS file_parents (
+            file_id TEXT NOT NULL,
+            parent_id TEXT NOT NULL,
+            PRIMARY KEY (file_id, parent_id)
+        );
+        CREATE INDEX IF NOT EXISTS file_parents_parent ON file_parents (parent_id);
+    """
+
+    def __init__(self, drive, path=DEFAULT_PATH):
+
+        self.drive = drive
+        SQLiteStore.__init__(self, path)
+
+
+    @property
+    def page_token(self):
+        """The Changes API token from which the next `sync()` continues"""
+        return self._get_state('page_token')
+
+    def _set_page_token(self, token:str):
+        self._set_state('page_token', token)
+
+
+    def _put(self, file:dict):
+        """Inserts or replaces the metadata of a single file"""
+        parents = file.get('parents', [])
+
+        self.connection.execute(
+            "INSERT OR REPLACE INTO files (id, name, mimeType, parents, modifiedTime) VALUES (?, ?, ?, ?, ?)",
+            (file['id'], file['name'], file.get('mimeType'), json.dumps(parents), file.get('modifiedTime'))
+        )
+        self.connection.execute("DELETE FROM file_parents WHERE file_id = ?", (file['id'],))
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO file_parents (file_id, parent_id) VALUES (?, ?)",
+            [(file['id'], parent) for parent in parents]
+        )
+
+    def _remove(self, file_id:str):
+        """Removes a file from the index"""
+        self.connection.execute("DELETE FROM files WHERE id = ?", (file_id,))
+        self.connection.execute("DELETE FROM file_parents WHERE file_id = ?", (file_id,))
+
+
+    def crawl(self):
+        """
+        Rebuilds the whole index from a full listing of the drive.
+
+        The Changes API start token is taken *before* listing, so that
+        anything modified while the crawl runs is picked up by the next `sync()`.
+
+        Returns:
+        --------
+            `int`: number of files indexed
+        """
+        start_token = self.drive.executor.execute(self.drive.service.changes().getStartPageToken())['startPageToken']
+
+        with self.connection:
+            self.connection.execute("DELETE FROM files")
+            self.connection.execute("DELETE FROM file_parents")
+
+            count = 0
+            for file in self.drive.iter_files(query="trashed=false", fields=self.FIELDS):
+                self._put(file)
+                count += 1
+
+            self._set_page_token(start_token)
+
+        return count
+
+
+    def sync(self):
+        """
+        Brings the index up to date.
+
+        On the first run this is a full `crawl()`; afterwards only the changes
+        reported by `changes().list` since the last sync are applied.
+
+        Returns:
+        --------
+            `int`: number of files added, updated or removed
+        """
+        page_token = self.page_token
+
+        if page_token is None:
+            return self.crawl()
+
+        count = 0
+        with self.connection:
+            while page_token is not None:
+                res = self.drive.executor.execute(self.drive.service.changes().list(
+                    pageToken=page_token,
+                    pageSize=1000,
+                    includeRemoved=True,
+                    spaces="drive",
+                    fields=f"nextPageToken, newStartPageToken, changes(fileId, removed, file({self.FIELDS}))"
+                ))
+
+                for change in res.get('changes', []):
+                    file = change.get('file')
+                    if change.get('removed') or file is None or file.get('trashed'):
+                        self._remove(change['fileId'])
+                    else:
+                        self._put(file)
+                    count += 1
+
+                if 'newStartPageToken' in res:
+                    self._set_page_token(res['newStartPageToken'])
+                    break
+
+                page_token = res.get('nextPageToken')
+
+        return count
+
+
+    @staticmethod
+    def _row_to_dict(row):
+        return {
+            'id': row['id'],
+            'name': row['name'],
+            'mimeType': row['mimeType'],
+            'parents': json.loads(row['parents']),
+            'modifiedTime': row['modifiedTime']
+        }
+
+    def get(self, file_id:str):
+        """
+        Returns:
+        --------
+            `dict` with keys 'id', 'name', 'mimeType', 'parents', 'modifiedTime'
+            or `None` if the file is not in the index
+        """
+        row = self.connection.execute("SELECT * FROM files WHERE id = ?", (file_id,)).fetchone()
+        return None if row is None else self._row_to_dict(row)
+
+
+    def find(self, name:str, parent_id:str=None, mimetype:str=None):
+        """
+        Returns a `list` of metadata `dict`s of the indexed files named `name`,
+        optionally restricted to the children of `parent_id` and to `mimetype`.
+        """
+        sql = "SELECT files.* FROM files"
+        params = []
+
+        if parent_id is not None:
+            sql += " JOIN file_parents ON file_parents.file_id = files.id AND file_parents.parent_id = ?"
+            params.append(parent_id)
+
+        sql += " WHERE files.name = ?"
+        params.append(name)
+
+        if mimetype is not None:
+            sql += " AND files.mimeType = ?"
+            params.append(mimetype)
+
+        return [self._row_to_dict(row) for row in self.connection.execute(sql, params)]
+
+
+    def get_file_id(self, filename:str, parent_cloud_dir_id=None):
+        """
+        Returns the id of a (non folder) file called `filename` or `None`
+        if there is no such file in the index
+        """
+        for file in self.find(filename, parent_id=parent_cloud_dir_id):
+            if file['mimeType'] != self.FOLDER_MIMETYPE:
+                return file['id']
+        return None
+
+
+    def get_directory_ids(self, dir_name:str):
+        """Returns the `list` of ids of all folders called `dir_name`"""
+        return [file['id'] for file in self.find(dir_name, mimetype=self.FOLDER_MIMETYPE)]
+
+
+def main():
+    print('Local metadata index for Google Drive')
+
+
+if __name__ == '__main__':
+    main()
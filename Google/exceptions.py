@@ -18,6 +18,54 @@ class WorksheetNotFound(GoogleSheetError):
 class CellNotFound(GoogleSheetError):
     """Cell lookup exception."""
 
+class CacheMiss(GoogleSheetError):
+    """The requested values are not in the local cache (offline mode)."""
+
+
+class GoogleAPIError(Exception):
+    """
+    A base class for errors returned by a Google API call.
+
+    Attributes:
+    -----------
+        `status`: `int` HTTP status of the failed call (`None` for network errors)
+        `reason`: `str` the API's error reason, e.g. 'rateLimitExceeded' (may be `None`)
+    """
+
+    def __init__(self, message, status=None, reason=None):
+        super().__init__(message)
+        self.status = status
+        self.reason = reason
+
+class TransientError(GoogleAPIError):
+    """A server side or network error that persisted after all retries."""
+
+class RateLimitExceeded(TransientError):
+    """The API's rate limit or quota was still exceeded after all retries."""
+
+class BadRequest(GoogleAPIError):
+    """The request was invalid (HTTP 400)."""
+
+class AuthenticationError(GoogleAPIError):
+    """The credentials were missing or invalid (HTTP 401)."""
+
+class PermissionDenied(GoogleAPIError):
+    """The credentials do not allow this call (HTTP 403)."""
+
+class NotFound(GoogleAPIError):
+    """The requested resource does not exist or is not visible (HTTP 404 / 410)."""
+
+
+class WorkerServiceError(Exception):
+    """No service can be built for a worker thread (a ready service was given without a `service_factory`)."""
+
+
+class GoogleDriveError(Exception):
+    """A base class for google drive exceptions."""
+
+class ChecksumMismatch(GoogleDriveError):
+    """The md5 checksum reported by Drive differs from the local file's."""
+
 
 def main():
     print('\nExceptions for Google module!')
@@ -0,0 +1,265 @@
+# Local message store for Gmail, kept current through historyId
+#
+# Author: Indrajit Ghosh
+#
+# Date: Oct 17, 2026
+#
+
+import json
+from pathlib import Path
+
+from .exceptions import NotFound
+from .sqlite_store import SQLiteStore
+
+__all__ = ['GmailStore']
+
+
+class GmailStore(SQLiteStore):
+    """
+    An on-disk (SQLite) store of the messages of a Gmail label.
+
+    The store is filled once by a full listing of the label and is then kept
+    current through `users().history().list`: every `sync()` fetches only the
+    messages added to the label since the `historyId` of the previous one (and
+    drops the deleted ones and those taken off the label), so reading the stored
+    messages needs no network round trip.
+
+    Parameters:
+    -----------
+        `gmail`: `Gmail`; the account whose messages are stored. Any object with
+                `service` and `executor` attributes and the `iter_messages()` and
+                `get_message_resources()` methods works (see `testing.check_gmail_store()`,
+                which runs it on a fake Gmail service).
+        `path`: optional; location of the SQLite database file.
+                Use ':memory:' for a throw away store.
+        `label_id`: `str`; the label whose messages are stored
+
+    Example:
+    --------
+        >>> store = GmailStore(gmail=Gmail())
+        >>> store.sync()   # full listing on the first run, incremental afterwards
+            {'full': False, 'added': 2, 'deleted': 0}
+        >>> store.messages(limit=5)
+    """
+
+    DEFAULT_PATH = Path(__file__).resolve().parent / '.cache' / 'gmail_store.sqlite3'
+    TABLE = 'messages'
+    HISTORY_TYPES = ['messageAdded', 'messageDeleted', 'labelAdded', 'labelRemoved']
+    HISTORY_FIELDS = (
+        "nextPageToken, historyId, history(messagesAdded/message/id, messagesDeleted/message/id, "
+        "labelsAdded(message/id, labelIds), labelsRemoved(message/id, labelIds))"
+    )
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS messages (
+            id TEXT PRIMARY KEY,
+            threadId TEXT,
+            internalDate INTEGER,
+            labelIds TEXT,
+            subject TEXT,
+            sender TEXT,
+            date TEXT,
+            body TEXT
+        );
+        CREATE INDEX IF NOT EXISTS messages_internalDate ON messages (internalDate);
+    """
+
+    def __init__(self, gmail, path=DEFAULT_PATH, label_id:str='INBOX'):
+
+        self.gmail = gmail
+        self.label_id = label_id
+        SQLiteStore.__init__(self, path)
+
+
+    @property
+    def history_id(self):
+        """The `historyId` from which the next `sync()` continues"""
+        return self._get_state('history_id')
+
+    def _set_history_id(self, history_id:str):
+        self._set_state('history_id', history_id)
+
+
+    def _put(self, msg:dict):
+        """Inserts or replaces a `messages().get` resource"""
+        from .model import Gmail
+
+        payload = msg['payload']
+        headers = {h['name'].lower(): h['value'] for h in payload.get('headers', [])}
+
+        self.connection.execute(
+            "INSERT OR REPLACE INTO messages (id, threadId, internalDate, labelIds, subject, sender, date, body) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                msg['id'],
+                msg.get('threadId'),
+                int(msg.get('internalDate', 0)),
+                json.dumps(msg.get('labelIds', [])),
+                headers.get('subject', ''),
+                headers.get('from', ''),
+                headers.get('date', ''),
+                Gmail.extract_body(payload),
+            )
+        )
+
+    def _remove(self, message_id:str):
+        self.connection.execute("DELETE FROM messages WHERE id = ?", (message_id,))
+
+
+    def _fetch(self, message_ids:list):
+        """Fetches and stores the messages in batches; returns the number stored"""
+        resources, errors = self.gmail.get_message_resources(message_ids)
+
+        for msg in resources.values():
+            self._put(msg)
+
+        # A message deleted since it was listed is simply not stored
+        for message_id, error in errors.items():
+            if not isinstance(error, NotFound):
+                raise error
+
+        return len(resources)
+
+
+    def crawl(self):
+        """
+        Rebuilds the whole store from a full listing of the label.
+
+        The `historyId` is taken *before* listing, so that anything arriving
+        while the listing runs is picked up by the next `sync()`.
+
+        Returns:
+        --------
+            `int`: number of messages stored
+        """
+        history_id = self.gmail.executor.execute(self.gmail.service.users().getProfile(userId='me'))['historyId']
+        message_ids = [m['id'] for m in self.gmail.iter_messages(label_ids=[self.label_id])]
+
+        with self.connection:
+            self.connection.execute("DELETE FROM messages")
+            count = self._fetch(message_ids)
+            self._set_history_id(history_id)
+
+        return count
+
+
+    def sync(self):
+        """
+        Brings the store up to date.
+
+        On the first run, and whenever Gmail no longer has the history since the
+        stored `historyId` (HTTP 404, it is kept for about a week), this is a full
+        `crawl()`; otherwise only the messages added since the last sync, or newly
+        given the label, are fetched, and those deleted or taken off the label dropped.
+
+        Returns:
+        --------
+            `dict`: {'full': `bool`, 'added': `int`, 'deleted': `int`}
+        """
+        history_id = self.history_id
+
+        if history_id is None:
+            return {'full': True, 'added': self.crawl(), 'deleted': 0}
+
+        added = {}
+        deleted = set()
+        page_token = None
+
+        try:
+            while True:
+                res = self.gmail.executor.execute(self.gmail.service.users().history().list(
+                    userId='me',
+                    startHistoryId=history_id,
+                    historyTypes=self.HISTORY_TYPES,
+                    labelId=self.label_id,
+                    pageToken=page_token,
+                    fields=self.HISTORY_FIELDS
+                ))
+
+                # Records are in chronological order; the last change of a message wins
+                for record in res.get('history', []):
+                    for m in record.get('messagesAdded', []):
+                        added[m['message']['id']] = None
+                        deleted.discard(m['message']['id'])
+                    for m in record.get('labelsAdded', []):
+                        if self.label_id in m.get('labelIds', []):
+                            added[m['message']['id']] = None
+                            deleted.discard(m['message']['id'])
+                    for m in record.get('messagesDeleted', []):
+                        added.pop(m['message']['id'], None)
+                        deleted.add(m['message']['id'])
+                    for m in record.get('labelsRemoved', []):
+                        if self.label_id in m.get('labelIds', []):
+                            added.pop(m['message']['id'], None)
+                            deleted.add(m['message']['id'])
+
+                page_token = res.get('nextPageToken')
+                if page_token is None:
+                    break
+        except NotFound:
+            return {'full': True, 'added': self.crawl(), 'deleted': 0}
+
+        with self.connection:
+            count = self._fetch(list(added)) if added else 0
+            for message_id in deleted:
+                self._remove(message_id)
+            self._set_history_id(res['historyId'])
+
+        return {'full': False, 'added': count, 'deleted': len(deleted)}
+
+
+    @staticmethod
+    def _row_to_dict(row):
+        return {
+            'id': row['id'],
+            'threadId': row['threadId'],
+            'internalDate': row['internalDate'],
+            'labelIds': json.loads(row['labelIds']),
+            'subject': row['subject'],
+            'sender': row['sender'],
+            'date': row['date'],
+            'body': row['body'],
+        }
+
+    def get(self, message_id:str):
+        """
+        Returns:
+        --------
+            `dict` with keys 'id', 'threadId', 'internalDate', 'labelIds', 'subject',
+            'sender', 'date', 'body' or `None` if the message is not in the store
+        """
+        row = self.connection.execute("SELECT * FROM messages WHERE id = ?", (message_id,)).fetchone()
+        return None if row is None else self._row_to_dict(row)
+
+
+    def messages(self, limit:int=None, sender:str=None, subject:str=None):
+        """
+        Returns the stored messages, newest first, optionally only those whose
+        sender / subject contains `sender` / `subject` (case insensitive).
+        """
+        sql = "SELECT * FROM messages WHERE 1 = 1"
+        params = []
+
+        if sender is not None:
+            sql += " AND sender LIKE ?"
+            params.append(f"%{sender}%")
+
+        if subject is not None:
+            sql += " AND subject LIKE ?"
+            params.append(f"%{subject}%")
+
+        sql += " ORDER BY internalDate DESC"
+
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [self._row_to_dict(row) for row in self.connection.execute(sql, params)]
+
+
+def main():
+    print('Local message store for Gmail')
+
+
+if __name__ == '__main__':
+    main()
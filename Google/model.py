@@ -6,23 +6,37 @@
 #
 
 
-import os, io, base64
+import os, base64
+import errno
+import itertools
+import hashlib
+import json
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os.path
+import random
+import re
+import socket
+import ssl
+from datetime import datetime, timezone
 from pathlib import Path
 from pprint import pprint
-from bs4 import BeautifulSoup
+from urllib.parse import quote
+
+import httplib2
 
-from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
 
 from googleapiclient.http import MediaFileUpload
 from googleapiclient.http import MediaIoBaseDownload
 
 from email.mime.multipart import MIMEMultipart
-from email.utils import formataddr, formatdate, COMMASPACE
+from email.utils import formataddr, formatdate, COMMASPACE, parsedate_to_datetime
 from email.mime.text import MIMEText
 from email.mime.audio import MIMEAudio
 from email.mime.base import MIMEBase
@@ -31,9 +45,13 @@ from email.mime.application import MIMEApplication
 from email import encoders
 import mimetypes
 
-from google.oauth2 import service_account
+# N.B: `bs4`, `google_auth_oauthlib`, `google.auth.transport.requests` and
+# `google.oauth2.service_account` are slow to import and only needed by a few
+# methods, so they are imported inside those methods.
 
 from .exceptions import *
+from .drive_index import DriveIndex
+from .gmail_store import GmailStore
 
 
 class EmailMessage(MIMEMultipart):
@@ -169,6 +187,360 @@ class EmailMessage(MIMEMultipart):
             self.attach(attachment)
 
 
+# HTTP statuses worth retrying: rate limits and server side hiccups
+TRANSIENT_HTTP_STATUSES = (429, 500, 502, 503, 504)
+
+# 403 reasons that mean "slow down" rather than "not allowed"
+RATE_LIMIT_REASONS = ('rateLimitExceeded', 'userRateLimitExceeded', 'quotaExceeded')
+
+# Network level failures worth retrying
+TRANSIENT_NETWORK_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    socket.timeout,
+    socket.gaierror,
+    ssl.SSLError,
+    httplib2.HttpLib2Error,
+)
+
+# Other `OSError`s are transient only for these (network) errno values; e.g. a
+# `FileNotFoundError` while reading an upload is not
+TRANSIENT_ERRNOS = {
+    errno.ENETDOWN, errno.ENETUNREACH, errno.ENETRESET, errno.EHOSTDOWN,
+    errno.EHOSTUNREACH, errno.ECONNABORTED, errno.ECONNRESET, errno.ETIMEDOUT, errno.EPIPE,
+}
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket limiting how fast API calls are made.
+
+    Parameters:
+    -----------
+        `rate`: `float`; tokens (i.e. calls) added per second
+        `capacity`: `int`; largest burst allowed, defaults to one second worth of tokens
+
+    A request for more tokens than `capacity` (e.g. a batch of many calls) waits
+    for a full bucket and leaves it in debt, so the following calls wait for the rest.
+    """
+
+    def __init__(self, rate:float, capacity:int=None):
+
+        self.rate = rate
+        self.capacity = max(1, rate) if capacity is None else capacity
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} rate:{self.rate}/s capacity:{self.capacity}>"
+
+    def acquire(self, tokens:float=1):
+        """Blocks until `tokens` tokens are available and takes them"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+
+                needed = min(tokens, self.capacity)
+                if self._tokens >= needed:
+                    self._tokens -= tokens
+                    return
+
+                wait = (needed - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class RequestExecutor:
+    """
+    The single place where API calls are executed.
+
+    Every call waits for the optional `rate_limiter`, and transient failures
+    (see `TRANSIENT_HTTP_STATUSES`, `RATE_LIMIT_REASONS` and `TRANSIENT_NETWORK_ERRORS`)
+    are retried with jittered exponential backoff, honouring the server's
+    `Retry-After` header. Errors that remain are raised as the typed exceptions
+    of `exceptions.py` (`NotFound`, `PermissionDenied`, `RateLimitExceeded`, ...).
+
+    Calls that are not idempotent (sending a mail, creating a file, ...) are made
+    with `idempotent=False`: they are only retried when the server certainly did
+    not act on them (see `is_safe_to_resend()`), so a retry never duplicates them.
+
+    Parameters:
+    -----------
+        `retries`: `int`; how many times a failed call is retried
+        `backoff`: `float`; seconds to wait before the first retry; doubled on every retry
+        `max_backoff`: `float`; longest wait between two attempts
+        `rate_limiter`: optional; a `RateLimiter` shared by all calls of this executor
+
+    Example:
+    --------
+        >>> executor = RequestExecutor(rate_limiter=RateLimiter(rate=10))
+        >>> executor.execute(service.files().get(fileId=file_id))
+    """
+
+    def __init__(self, retries:int=5, backoff:float=1.0, max_backoff:float=64.0, rate_limiter:RateLimiter=None):
+
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.rate_limiter = rate_limiter
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} retries:{self.retries} rate_limiter:{self.rate_limiter}>"
+
+
+    @staticmethod
+    def error_reason(error:HttpError):
+        """The API's reason code of an `HttpError`, e.g. 'rateLimitExceeded', or `None`"""
+        details = error.error_details
+        if isinstance(details, list) and details and isinstance(details[0], dict):
+            return details[0].get('reason')
+        return None
+
+    @classmethod
+    def is_transient(cls, error:Exception):
+        """Whether retrying the call that raised `error` may succeed"""
+        if isinstance(error, HttpError):
+            return (
+                error.resp.status in TRANSIENT_HTTP_STATUSES
+                or (error.resp.status == 403 and cls.error_reason(error) in RATE_LIMIT_REASONS)
+            )
+        if isinstance(error, TRANSIENT_NETWORK_ERRORS):
+            return True
+        return isinstance(error, OSError) and error.errno in TRANSIENT_ERRNOS
+
+    @classmethod
+    def is_safe_to_resend(cls, error:Exception):
+        """
+        Whether a non-idempotent call that raised `error` was certainly not acted
+        upon: it was rate limited (429 or a 403 rate limit reason) or the
+        connection was refused before the request was sent.
+        """
+        if isinstance(error, HttpError):
+            return (
+                error.resp.status == 429
+                or (error.resp.status == 403 and cls.error_reason(error) in RATE_LIMIT_REASONS)
+            )
+        return isinstance(error, ConnectionRefusedError)
+
+    @staticmethod
+    def retry_after(error:Exception):
+        """Seconds to wait as asked by the server's `Retry-After` header, or `None`"""
+        if not isinstance(error, HttpError):
+            return None
+
+        value = error.resp.get('retry-after')
+        if value is None:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def to_api_error(cls, error:Exception):
+        """Converts an `HttpError` or network error into the matching `GoogleAPIError`"""
+        if not isinstance(error, HttpError):
+            return TransientError(f"Network error: {error}")
+
+        status = error.resp.status
+        reason = cls.error_reason(error)
+        message = f"HTTP {status} when requesting {error.uri}: {error._get_reason()}"
+
+        if status == 429 or (status == 403 and reason in RATE_LIMIT_REASONS):
+            error_class = RateLimitExceeded
+        elif status >= 500:
+            error_class = TransientError
+        elif status == 400:
+            error_class = BadRequest
+        elif status == 401:
+            error_class = AuthenticationError
+        elif status == 403:
+            error_class = PermissionDenied
+        elif status in (404, 410):
+            error_class = NotFound
+        else:
+            error_class = GoogleAPIError
+
+        return error_class(message, status=status, reason=reason)
+
+
+    def call(self, function, *args, idempotent:bool=True, tokens:int=1, **kwargs):
+        """
+        Calls `function(*args, **kwargs)`, which makes one API call, with
+        rate limiting and retries. Use it for things like `MediaIoBaseDownload.next_chunk`.
+
+        With `idempotent=False` the call is only retried if `is_safe_to_resend()`.
+        `tokens` is what the call costs from the `rate_limiter`, e.g. the number of
+        sub-requests of a batch HTTP call.
+        """
+        retryable = self.is_transient if idempotent else self.is_safe_to_resend
+
+        for attempt in range(self.retries + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(tokens)
+
+            try:
+                return function(*args, **kwargs)
+
+            except (HttpError, OSError, httplib2.HttpLib2Error) as error:
+                if not isinstance(error, HttpError) and not self.is_transient(error):
+                    raise # a local failure, e.g. an unreadable file, not an API error
+
+                if attempt == self.retries or not retryable(error):
+                    raise self.to_api_error(error) from error
+
+                wait = self.retry_after(error)
+                if wait is None:
+                    wait = min(self.max_backoff, self.backoff * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+                time.sleep(wait)
+
+    def execute(self, request, idempotent:bool=True, tokens:int=1, **kwargs):
+        """Executes a `googleapiclient` request (anything with an `execute()` method)"""
+        return self.call(request.execute, idempotent=idempotent, tokens=tokens, **kwargs)
+
+
+class GoogleClientRegistry:
+    """
+    Process-wide registry of Google credentials and API services
+
+    Author: Indrajit Ghosh
+
+    Date: Oct 17, 2026
+
+    Credentials are loaded (and refreshed if needed) once per process, the
+    discovery documents are read once from the copies shipped with
+    `googleapiclient` (static discovery), and every thread gets its own
+    service object per API, since `googleapiclient` services are not thread-safe.
+
+    Example:
+    --------
+        >>> creds = GoogleClientRegistry.get_credentials(key, loader)
+        >>> service = GoogleClientRegistry.get_service('drive', creds)
+    """
+
+    # client name -> (api name, api version)
+    APIS = {
+        'drive': ('drive', 'v3'),
+        'gmail': ('gmail', 'v1'),
+        'sheet': ('sheets', 'v4')
+    }
+
+    # Client side rate limits (calls per second, burst), kept below the per-user quotas;
+    # every sub-request of a batch counts as a call
+    RATE_LIMITS = {
+        'drive': (20, 40),
+        'gmail': (10, 20),
+        'sheet': (0.75, 10) # 60 read and 60 write requests per minute per user: at most 10 + 45 in any minute
+    }
+
+    _lock = threading.Lock()
+    _executors = {} # client -> RequestExecutor
+    _credentials = {} # key -> credentials
+    _discovery_documents = {} # (api name, api version) -> discovery document (`str`)
+    _local = threading.local()
+
+    @classmethod
+    def get_credentials(cls, key, loader):
+        """
+        Returns the credentials cached under `key`; on the first call
+        they are created with the zero argument callable `loader`.
+        """
+        with cls._lock:
+            if key not in cls._credentials:
+                cls._credentials[key] = loader()
+            return cls._credentials[key]
+
+    @classmethod
+    def discovery_document(cls, api:str, version:str):
+        """Returns the discovery document of the API or `None` if there is no static copy"""
+        with cls._lock:
+            if (api, version) not in cls._discovery_documents:
+                cls._discovery_documents[(api, version)] = get_static_doc(api, version)
+            return cls._discovery_documents[(api, version)]
+
+    @classmethod
+    def build_service(cls, client:str, credentials):
+        """Builds a new service object of `client` ('drive', 'gmail' or 'sheet')"""
+        try:
+            api, version = cls.APIS[client.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown client `{client}`; it can be one of {list(cls.APIS)}.")
+
+        document = cls.discovery_document(api, version)
+        if document is None:
+            # Fetching the discovery document is an API call too: retried, errors typed
+            return cls.get_executor(client).call(build, api, version, credentials=credentials)
+
+        return build_from_document(document, credentials=credentials)
+
+    @classmethod
+    def get_service(cls, client:str, credentials):
+        """
+        Returns the calling thread's service object of `client` for `credentials`,
+        building it on first use.
+        """
+        services = cls._local.__dict__.setdefault('services', {})
+        key = (client.lower(), id(credentials))
+
+        if key not in services or services[key][0] is not credentials:
+            services[key] = (credentials, cls.build_service(client, credentials))
+
+        return services[key][1]
+
+    @classmethod
+    def get_worker_service(cls, client:str, local:threading.local, service_factory=None, credentials=None):
+        """
+        Returns the calling worker thread's service of `client`, built once per
+        thread and kept on `local`: by `service_factory` if one is given,
+        otherwise from `credentials` (see `get_service()`).
+
+        Raises `WorkerServiceError` if there is neither.
+        """
+        service = getattr(local, 'service', None)
+
+        if service is None:
+            if service_factory is not None:
+                service = service_factory()
+            elif credentials is not None:
+                service = cls.get_service(client, credentials)
+            else:
+                raise WorkerServiceError("A `service_factory` is needed to run workers on an externally built service.")
+            local.service = service
+
+        return service
+
+    @classmethod
+    def get_executor(cls, client:str):
+        """
+        Returns the process-wide `RequestExecutor` of `client`, whose rate
+        limiter is shared by every thread calling that API.
+        """
+        client = client.lower()
+        with cls._lock:
+            if client not in cls._executors:
+                rate, capacity = cls.RATE_LIMITS[client]
+                cls._executors[client] = RequestExecutor(rate_limiter=RateLimiter(rate=rate, capacity=capacity))
+            return cls._executors[client]
+
+    @classmethod
+    def clear(cls):
+        """Forgets all cached credentials and discovery documents (services of other threads are kept)"""
+        with cls._lock:
+            cls._credentials.clear()
+            cls._discovery_documents.clear()
+        cls._local.__dict__.pop('services', None)
+
+
 class GoogleClient:
     """
     Class representing a Google client
@@ -206,18 +578,14 @@ class GoogleClient:
         client_secret_file=CLIENT_SECRET_FILE
     ):
     
-        # Getting credentials
-        self.credentials = self.get_creds(authorized_user_file=authorized_user_file, client_secret_file=client_secret_file)
+        # Getting credentials; they are read from `token.json` only once per process
+        self.credentials = GoogleClientRegistry.get_credentials(
+            key=('user', str(authorized_user_file), str(client_secret_file)),
+            loader=lambda: self.get_creds(authorized_user_file=authorized_user_file, client_secret_file=client_secret_file)
+        )
 
-        if client.lower() == 'drive':
-            # create drive api client
-            self.service = build('drive', 'v3', credentials=self.credentials)
-        elif client.lower() == 'gmail':
-            # create gmail api client
-            self.service = build('gmail', 'v1', credentials=self.credentials)
-        elif client.lower() == 'sheet':
-            # create google sheet api client
-            self.service = build('sheets', 'v4', credentials=self.credentials)
+        # create the drive, gmail or google sheet api client
+        self.service = GoogleClientRegistry.get_service(client, self.credentials)
 
 
     def get_creds(self, authorized_user_file, client_secret_file):
@@ -229,6 +597,9 @@ class GoogleClient:
             `authorized_user_file`: `token.json`
             `client_secret_file`: `credentials.json`
         """
+        from google.auth.transport.requests import Request
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
         creds = None
         # The file token.json stores the user's access and refresh tokens, and is
         # created automatically when the authorization flow completes for the first
@@ -264,27 +635,81 @@ class GoogleServiceAccountClient:
     SERVICE_ACC_KEYS_FILE = Path(__file__).resolve().parent / 'keys.json'
 
     def __init__(self, client='sheet'):
-        
-        creds = None
-        try:
-            creds = service_account.Credentials.from_service_account_file(self.SERVICE_ACC_KEYS_FILE, scopes=self.SCOPES)
 
-            # Getting credentials
-            self.credentials = creds
+        from google.oauth2 import service_account
 
-            if client.lower() == 'drive':
-                # create drive api client
-                self.service = build('drive', 'v3', credentials=self.credentials)
-            elif client.lower() == 'gmail':
-                # create gmail api client
-                self.service = build('gmail', 'v1', credentials=self.credentials)
-            elif client.lower() == 'sheet':
-                # create google sheet api client
-                self.service = build('sheets', 'v4', credentials=self.credentials)
+        # Getting credentials
+        self.credentials = GoogleClientRegistry.get_credentials(
+            key=('service_account', str(self.SERVICE_ACC_KEYS_FILE)),
+            loader=lambda: service_account.Credentials.from_service_account_file(
+                self.SERVICE_ACC_KEYS_FILE, scopes=self.SCOPES
+            )
+        )
+
+        # create the drive, gmail or google sheet api client
+        self.service = GoogleClientRegistry.get_service(client, self.credentials)
+
+
+def execute_batch(service, requests:dict, batch_size:int=100, retries:int=3, backoff:float=1.0, executor:RequestExecutor=None,
+                  idempotent:bool=True):
+    """
+    Executes many API requests through the batch endpoint of `service`
+    (`service.new_batch_http_request()`), `batch_size` of them per HTTP call.
+
+    Sub-requests that fail with a transient error (see `RequestExecutor.is_transient()`)
+    are retried, on their own, up to `retries` more times with a jittered exponential pause.
+    With `idempotent=False` (e.g. deletes, whose repetition fails with a 404) the batch
+    and its sub-requests are only retried if `RequestExecutor.is_safe_to_resend()`.
+
+    Parameters:
+    -----------
+        `service`: a `googleapiclient` service
+        `requests`: `dict` key -> zero argument callable that builds the request, e.g.
+                    {file_id: lambda: service.files().get(fileId=file_id)}
+                    (a request object can not be added to a second batch, so it is rebuilt on retry)
+        `batch_size`: `int`; at most the server-side limit of the API (100 for Drive and Gmail)
+        `executor`: optional; the `RequestExecutor` that sends every batch HTTP call,
+                    charging its rate limiter one token per sub-request
+        `idempotent`: `bool`; whether the requests can be repeated with the same outcome
+
+    Returns:
+    --------
+        `(results, errors)`: two `dict`s keyed like `requests`, holding the response of
+                every successful sub-request and the `GoogleAPIError` of every failed one.
+    """
+    executor = RequestExecutor() if executor is None else executor
+    retryable = RequestExecutor.is_transient if idempotent else RequestExecutor.is_safe_to_resend
+
+    results = {}
+    errors = {}
+    pending = list(requests)
 
+    for attempt in range(retries + 1):
+        for start in range(0, len(pending), batch_size):
+            keys = pending[start:start + batch_size]
+
+            def callback(request_id, response, exception, keys=keys):
+                key = keys[int(request_id)]
+                if exception is not None:
+                    errors[key] = exception
+                else:
+                    results[key] = response
+                    errors.pop(key, None)
 
-        except HttpError as err:
-            print(f'ERROR: {err}')
+            batch = service.new_batch_http_request(callback=callback)
+            for i, key in enumerate(keys):
+                batch.add(requests[key](), request_id=str(i))
+            executor.execute(batch, idempotent=idempotent, tokens=len(keys))
+
+        pending = [key for key in pending if key in errors and retryable(errors[key])]
+        if not pending or attempt == retries:
+            break
+
+        time.sleep(min(executor.max_backoff, backoff * 2 ** attempt) * random.uniform(0.5, 1.0))
+
+    errors = {key: RequestExecutor.to_api_error(error) for key, error in errors.items()}
+
+    return results, errors
 
 
 class GoogleDrive:
@@ -303,16 +728,139 @@ class GoogleDrive:
     "gform": 'application/vnd.google-apps.form'
     }
 
-    def __init__(self, **kwargs):
+    # Formats in which Google Docs editor files are exported when downloaded
+    EXPORT_MIMETYPES = {
+        MIMETYPES['gdoc']: "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        MIMETYPES['gsheet']: "text/csv", # you can change it to "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet" also
+        MIMETYPES['gslide']: "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        MIMETYPES['gform']: "application/vnd.google-apps.script+json"
+    }
+
+    FOLDER_MIMETYPE = 'application/vnd.google-apps.folder'
+
+    METADATA_FIELDS = "id, name, mimeType, size, md5Checksum"
+
+    BATCH_SIZE = 100 # largest number of calls Drive accepts in one batch request
+
+    DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024 # bytes
+    MAX_IN_MEMORY_SIZE = 32 * 1024 * 1024 # bytes; largest download that `download_file()` returns as `bytes`
+
+    UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024 # bytes; must be a multiple of 256 KB
+    UPLOAD_STATE_DIR = Path(__file__).resolve().parent / '.cache' / 'uploads'
+
+    def __init__(self, service=None, index=None, service_factory=None, executor:RequestExecutor=None, **kwargs):
+        """
+        Parameters
+        ----------
+            `service`: optional; an already built Drive service (e.g. a fake one for testing)
+            `index`: optional; a `DriveIndex` used to answer metadata lookups locally
+                    (see `enable_index()`)
+            `service_factory`: optional; a callable returning a new Drive service. It is used
+                    to give every worker thread of the bulk methods its own service, since
+                    `googleapiclient` services are not thread-safe.
+            `executor`: optional; the `RequestExecutor` running every API call, defaults
+                    to the process-wide Drive executor of `GoogleClientRegistry`
+        """
+
+        self.credentials = None
+
+        if service is None:
+            # create drive api client
+            drive = GoogleClient(client='drive', **kwargs)
+            service = drive.service
+            self.credentials = drive.credentials
+
+        self.service = service
+        self.index = index
+        self.service_factory = service_factory
+        self.executor = GoogleClientRegistry.get_executor('drive') if executor is None else executor
+        self._local = threading.local()
+
+
+    def _worker_drive(self):
+        """
+        Returns a `GoogleDrive` with a service of its own for the calling thread,
+        so that worker threads never share one `googleapiclient` service.
+        """
+        drive = getattr(self._local, 'drive', None)
+
+        if drive is None:
+            service = GoogleClientRegistry.get_worker_service(
+                'drive', self._local, service_factory=self.service_factory, credentials=self.credentials
+            )
+            drive = GoogleDrive(service=service, executor=self.executor)
+            self._local.drive = drive
+
+        return drive
 
-        # create drive api client
-        drive = GoogleClient(client='drive', **kwargs)
-        self.service = drive.service
 
+    def enable_index(self, path=DriveIndex.DEFAULT_PATH, sync:bool=True):
+        """
+        Attaches a local `DriveIndex` to this drive. Afterwards `get_file_id()`,
+        `get_directory_id()`, `get_filename()` and `get_mimetype()` are answered
+        from the index and only go to the network when the index has no answer.
+
+        Call `self.index.sync()` to pick up changes made elsewhere.
 
-    def get_filelist(self, directory_id=None, N:int=None):
+        Returns
+        -------
+            `DriveIndex`
         """
-        It returns a `list` of the last `N` many files of the directory with id `directory_id`
+        self.index = DriveIndex(drive=self, path=path)
+
+        if sync:
+            self.index.sync()
+
+        return self.index
+
+
+    def iter_files(self, directory_id=None, query:str=None, page_size:int=1000, fields:str="id, name, mimeType"):
+        """
+        Yields the files of the directory with id `directory_id` one at a time,
+        following `nextPageToken` until the listing is exhausted.
+
+        Parameters
+        ----------
+            `directory_id`: optional; restricts the listing to the children of this folder
+            `query`: optional; extra Drive search query, `and`-ed with the directory filter
+            `page_size`: `int`; number of files requested per page (Drive allows at most 1000)
+            `fields`: `str`; fields projection of every file, e.g. "id, name, mimeType, size"
+
+        Example
+        -------
+            >>> for file in drive.iter_files(directory_id, fields="id, name"):
+            ...     print(file['name'])
+        """
+        clauses = []
+        if directory_id is not None:
+            clauses.append(f"'{directory_id}' in parents and trashed=false")
+        if query is not None:
+            clauses.append(query)
+        q = " and ".join(clauses) if clauses else None
+
+        page_token = None
+        while True:
+            res = self.executor.execute(self.service.files().list(
+                q=q,
+                pageSize=page_size,
+                pageToken=page_token,
+                fields=f"nextPageToken, files({fields})",
+                spaces="drive"
+            ))
+
+            for file in res.get('files', []):
+                yield file
+
+            page_token = res.get('nextPageToken')
+            if page_token is None:
+                break
+
+
+    def get_filelist(self, directory_id=None, N:int=None, all_pages:bool=False, fields:str="id, name, mimeType"):
+        """
+        It returns a `list` of the last `N` many files of the directory with id `directory_id`.
+        If `all_pages` is `True` then every page of the listing is followed (see `iter_files()`)
+        and `N`, if given, caps the total number of files returned.
 
         Example
         -------
@@ -322,24 +870,30 @@ class GoogleDrive:
             ]
         """
 
-        try:
-            # create drive api client
-            service = self.service
+        if all_pages:
+            files = self.iter_files(directory_id=directory_id, fields=fields)
+            return list(files) if N is None else list(itertools.islice(files, N))
 
-            query = f"'{directory_id}' in parents and trashed=false" if directory_id is not None else directory_id
+        # create drive api client
+        service = self.service
 
-            # request a list of first N files or folders with name and id from the API.
-            res = service.files().list(
-                q=query,
-                pageSize=N, 
-                fields="files(id, name, mimeType)",
-                spaces="drive"
-            ).execute()
+        query = f"'{directory_id}' in parents and trashed=false" if directory_id is not None else directory_id
 
-            return res.get('files')
+        # request a list of first N files or folders with name and id from the API.
+        res = self.executor.execute(service.files().list(
+            q=query,
+            pageSize=N, 
+            fields=f"files({fields})",
+            spaces="drive"
+        ))
 
-        except HttpError as err:
-            print(f'ERROR: {err}')
+        return res.get('files')
+
+
+    @staticmethod
+    def _escape_query_value(value:str):
+        """Escapes a string so that it can be used inside a quoted Drive query value"""
+        return value.replace("\\", "\\\\").replace("'", "\\'")
 
 
     def get_file_id(self, filename:str, parent_cloud_dir_id=None):
@@ -347,20 +901,20 @@ class GoogleDrive:
         Return the file id of a file in the drive
         """
 
-        try:
-            # create drive api client
-            files_inside = self.get_filelist(directory_id=parent_cloud_dir_id)
-            not_found = True
+        if self.index is not None:
+            file_id = self.index.get_file_id(filename, parent_cloud_dir_id=parent_cloud_dir_id)
+            if file_id is not None:
+                return file_id
+
+        query = (
+            f"name = '{self._escape_query_value(filename)}'"
+            " and mimeType != 'application/vnd.google-apps.folder'"
+        )
 
-            for file in files_inside:
-                if file['mimeType'] != 'application/vnd.google-apps.folder' and file['name'] == filename:
-                    not_found = False
-                    return file['id']
-            if not_found:
-                raise FileNotFoundError(f"No file found with the name `{filename}`")
+        for file in self.iter_files(directory_id=parent_cloud_dir_id, query=query):
+            return file['id']
 
-        except HttpError as err:
-            print(f'ERROR: {err}')
+        raise FileNotFoundError(f"No file found with the name `{filename}`")
 
 
     def get_directory_id(self, dir_name:str):
@@ -369,25 +923,48 @@ class GoogleDrive:
         found exactly one then returns its id
         """
 
-        try:
-            allFolders = self.service.files().list(
-                q = f"mimeType = 'application/vnd.google-apps.folder' and name = '{dir_name}'",
-                fields="files(id, name, mimeType)",
-                spaces="drive"
-            ).execute()
-
-            if len(allFolders['files']) > 1:
+        if self.index is not None:
+            dir_ids = self.index.get_directory_ids(dir_name)
+            if len(dir_ids) > 1:
                 raise NotImplementedError(f"\nThere are multiple folders with name `{dir_name}`\n")
+            elif len(dir_ids) == 1:
+                return dir_ids[0]
 
-            elif allFolders['files'] == []:
-                raise FileNotFoundError(f"\nNo folders found with the name `{dir_name}`\n")
+        query = (
+            "mimeType = 'application/vnd.google-apps.folder'"
+            f" and name = '{self._escape_query_value(dir_name)}'"
+        )
 
-            else:
-                return allFolders['files'][0]['id']
+        # Two matches are enough to know that the name is ambiguous
+        folders = list(itertools.islice(self.iter_files(query=query), 2))
 
-        
-        except HttpError as err:
-            print(f'ERROR: {err}')
+        if len(folders) > 1:
+            raise NotImplementedError(f"\nThere are multiple folders with name `{dir_name}`\n")
+
+        elif folders == []:
+            raise FileNotFoundError(f"\nNo folders found with the name `{dir_name}`\n")
+
+        else:
+            return folders[0]['id']
+
+
+    def get_metadata(self, file_id, fields:str=METADATA_FIELDS):
+        """
+        Fetches the metadata of a file or folder in a single field-projected request
+
+        Accepts
+        -------
+            file or folder id
+
+        Returns
+        -------
+            `dict`; e.g.
+                {'id': '1ftoucUbxz10c1zoU1mDuqMr2NMIxhmbi', 'name': 'spam1', 'mimeType': 'application/pdf',
+                 'size': '48213', 'md5Checksum': '6c0b0b0a2f1b0d1e5a4b7ec1c5a3b9f2'}
+
+            Google Docs editor files have neither 'size' nor 'md5Checksum'.
+        """
+        return self.executor.execute(self.service.files().get(fileId=file_id, fields=fields))
 
 
     def get_filename(self, file_id):
@@ -400,14 +977,12 @@ class GoogleDrive:
         -------
             the filename
         """
-        try:
-            filename = self.service.files().get(fileId=file_id).execute()['name']
+        if self.index is not None:
+            file = self.index.get(file_id)
+            if file is not None:
+                return file['name']
 
-        except HttpError as err:
-            print(f'ERROR: {err}')
-            filename = None
-
-        return filename
+        return self.executor.execute(self.service.files().get(fileId=file_id, fields='name'))['name']
 
 
     def get_mimetype(self, file_id):
@@ -420,18 +995,63 @@ class GoogleDrive:
         -------
             the mimetype
         """
-        try:
-            mimeType = self.service.files().get(fileId=file_id).execute()['mimeType']
+        if self.index is not None:
+            file = self.index.get(file_id)
+            if file is not None:
+                return file['mimeType']
 
-        except HttpError as err:
-            print(f'ERROR: {err}')
-            mimeType = None
+        return self.executor.execute(self.service.files().get(fileId=file_id, fields='mimeType'))['mimeType']
 
-        return mimeType
+
+    @staticmethod
+    def md5_checksum(local_filepath, block_size:int=1024 * 1024):
+        """
+        Returns the hex md5 digest of a local file, i.e. what Drive reports as `md5Checksum`
+        """
+        md5 = hashlib.md5()
+        with open(local_filepath, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b''):
+                md5.update(block)
+        return md5.hexdigest()
+
+
+    def _upload_state_file(self, local_filepath:Path, cloud_dir_id:str=None, file_id:str=None):
+        """
+        Path of the file that keeps the progress of an interrupted upload of `local_filepath`.
+        A modified local file gets a different state file, so it is never resumed.
+        """
+        stat = local_filepath.stat()
+        key = f"{local_filepath.resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{cloud_dir_id}|{file_id}"
+        return self.UPLOAD_STATE_DIR / (hashlib.sha1(key.encode()).hexdigest() + '.json')
 
 
-    def upload_file(self, local_filepath, cloud_dir_id:str=None, print_status=True):
+    def upload_file(
+        self,
+        local_filepath,
+        cloud_dir_id:str=None,
+        print_status=True,
+        chunk_size:int=UPLOAD_CHUNK_SIZE,
+        verify_checksum:bool=True,
+        file_id:str=None
+    ):
         """
+        Uploads a file in resumable chunks of `chunk_size` bytes.
+
+        The upload session and the last byte confirmed by Drive are saved under
+        `UPLOAD_STATE_DIR` after every chunk. If the upload is interrupted (even by
+        a process restart), calling `upload_file()` again with the same unchanged
+        file picks up from there instead of starting over.
+
+        Parameters:
+        -----------
+            `local_filepath`: path of the file to upload
+            `cloud_dir_id`: optional; id of the Drive folder to upload into
+            `chunk_size`: `int`; bytes per request, a multiple of 256 KB
+            `verify_checksum`: if `True` the `md5Checksum` returned by Drive is compared
+                    with the local file and `ChecksumMismatch` is raised if they differ
+            `file_id`: optional; id of an existing Drive file whose content is replaced
+                    by the local file instead of creating a new file
+
         Returns:
         --------
             `str`: file_id of the uploaded file
@@ -440,29 +1060,160 @@ class GoogleDrive:
         local_filepath = Path(local_filepath)
         parents = [] if cloud_dir_id is None else [cloud_dir_id]
 
-        try:
-            # create drive api client
-            service = self.service
-
-            file_metadata = {
-                "name": local_filepath.name,
-                "parents": parents
-            }
+        state_file = self._upload_state_file(local_filepath, cloud_dir_id=cloud_dir_id, file_id=file_id)
+        state = json.loads(state_file.read_text()) if state_file.exists() else None
 
-            file_media = MediaFileUpload(local_filepath)
+        # create drive api client
+        service = self.service
 
-            upload_file = service.files().create(body=file_metadata, media_body=file_media, fields='id').execute()
+        file_metadata = {
+            "name": local_filepath.name,
+            "parents": parents
+        }
 
-            if print_status:
-                print(f"  Uploaded file: {local_filepath.name}\n  File id: {upload_file.get('id')}\n")
+        file_media = MediaFileUpload(local_filepath, chunksize=chunk_size, resumable=True)
 
-        except HttpError as error:
-            print(f'An error occurred: {error}')
-            upload_file = None
+        if file_id is None:
+            request = service.files().create(body=file_metadata, media_body=file_media, fields='id, md5Checksum')
+        else:
+            request = service.files().update(fileId=file_id, media_body=file_media, fields='id, md5Checksum')
+
+        if state is not None:
+            # Ask the server which bytes it already has before sending the next chunk
+            request.resumable_uri = state['resumable_uri']
+            request._in_error_state = True
+
+        upload_file = None
+        while upload_file is None:
+            # A failed chunk leaves the request in its error state, so a retry
+            # first asks the server for the last byte it has received
+            try:
+                status, upload_file = self.executor.call(request.next_chunk)
+
+            except NotFound:
+                if state is None:
+                    raise
+                # The saved upload session has expired; start a new one
+                state = None
+                request.resumable_uri = None
+                request.resumable_progress = 0
+                request._in_error_state = False
+                continue
+
+            if status is not None:
+                state = {'resumable_uri': request.resumable_uri, 'progress': status.resumable_progress}
+                state_file.parent.mkdir(parents=True, exist_ok=True)
+                state_file.write_text(json.dumps(state))
+
+                if print_status:
+                    print(f"  Upload {int(status.progress() * 100)}.")
+
+        state_file.unlink(missing_ok=True)
+
+        if verify_checksum:
+            local_md5 = self.md5_checksum(local_filepath)
+            if upload_file.get('md5Checksum') != local_md5:
+                raise ChecksumMismatch(
+                    f"Uploaded `{local_filepath.name}` (id: {upload_file.get('id')}) has md5 "
+                    f"{upload_file.get('md5Checksum')} but the local file has md5 {local_md5}."
+                )
+
+        if print_status:
+            print(f"  Uploaded file: {local_filepath.name}\n  File id: {upload_file.get('id')}\n")
 
         return upload_file.get('id')
 
 
+    def sync_directory(self, local_dir, cloud_dir_id:str, max_workers:int=4, print_status=True):
+        """
+        Mirrors the local directory tree `local_dir` into the Drive folder `cloud_dir_id`.
+
+        Missing sub-folders are created, new files are uploaded and files whose md5
+        checksum differs from their Drive copy are re-uploaded in place; unchanged
+        files are left alone. Nothing is deleted on Drive. The uploads run through a
+        pool of `max_workers` threads, each with a Drive service of its own.
+
+        Returns:
+        --------
+            `dict`: a report with keys
+                'uploaded': `list` of new files (paths relative to `local_dir`)
+                'updated': `list` of changed files re-uploaded
+                'unchanged': `list` of files already up to date
+                'folders_created': `list` of folders created
+                'failed': `dict` relative path -> error
+                'seconds': `float` wall-clock time taken
+        """
+        local_dir = Path(local_dir)
+
+        report = {'uploaded': [], 'updated': [], 'unchanged': [], 'folders_created': [], 'failed': {}}
+        start = time.perf_counter()
+
+        # (local_filepath, cloud_dir_id, existing file_id or None)
+        uploads = []
+
+        # Folders are created in the main thread, parents before children
+        cloud_dirs = {local_dir: (cloud_dir_id, True)} # local dir -> (cloud id, exists on Drive before this sync)
+
+        for dirpath, dirnames, filenames in os.walk(local_dir):
+            dirpath = Path(dirpath)
+            dirnames.sort()
+            cloud_id, existed = cloud_dirs[dirpath]
+
+            remote = {}
+            if existed:
+                for file in self.iter_files(directory_id=cloud_id, fields=self.METADATA_FIELDS):
+                    remote.setdefault(file['name'], file)
+
+            for dirname in dirnames:
+                file = remote.get(dirname)
+                if file is not None and file['mimeType'] == self.FOLDER_MIMETYPE:
+                    cloud_dirs[dirpath / dirname] = (file['id'], True)
+                else:
+                    new_id = self.create_folder(dirname, parent_dir_id=cloud_id, print_status=False)
+                    cloud_dirs[dirpath / dirname] = (new_id, False)
+                    report['folders_created'].append(str((dirpath / dirname).relative_to(local_dir)))
+
+            for filename in sorted(filenames):
+                local_filepath = dirpath / filename
+                file = remote.get(filename)
+
+                if file is None or file['mimeType'] == self.FOLDER_MIMETYPE:
+                    uploads.append((local_filepath, cloud_id, None))
+                elif file.get('md5Checksum') != self.md5_checksum(local_filepath):
+                    uploads.append((local_filepath, cloud_id, file['id']))
+                else:
+                    report['unchanged'].append(str(local_filepath.relative_to(local_dir)))
+
+        def upload(local_filepath, cloud_id, file_id):
+            drive = self._worker_drive()
+            return drive.upload_file(local_filepath, cloud_dir_id=cloud_id, print_status=False, file_id=file_id)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(upload, *args): args for args in uploads}
+
+            for future in as_completed(futures):
+                local_filepath, _, file_id = futures[future]
+                relpath = str(local_filepath.relative_to(local_dir))
+                try:
+                    future.result()
+                except Exception as error:
+                    report['failed'][relpath] = error
+                    continue
+
+                report['uploaded' if file_id is None else 'updated'].append(relpath)
+
+        report['seconds'] = time.perf_counter() - start
+
+        if print_status:
+            print(
+                f"  Uploaded {len(report['uploaded'])} new and {len(report['updated'])} changed file(s), "
+                f"{len(report['unchanged'])} unchanged, {len(report['failed'])} failed, "
+                f"{len(report['folders_created'])} folder(s) created in {report['seconds']:.2f} s\n"
+            )
+
+        return report
+
+
     @staticmethod
     def save_file(iofileObj, filename:str='untitled_file', download_dir=Path.cwd()):
         """
@@ -476,66 +1227,163 @@ class GoogleDrive:
             f.write(iofileObj)
 
     
-    def download_file(self, real_file_id, download_dir=Path.cwd()):
+    def download_file(
+        self,
+        real_file_id,
+        download_dir=Path.cwd(),
+        metadata:dict=None,
+        chunk_size:int=DOWNLOAD_CHUNK_SIZE,
+        return_bytes:bool=False,
+        print_status=True
+    ):
         """
-        Downloads a file
+        Downloads a file straight to disk.
+
+        The content is streamed in chunks of `chunk_size` bytes into a temporary
+        file inside `download_dir`, which is renamed to the final filename only
+        once the download is complete. So the memory used does not grow with the
+        file size and an interrupted download never leaves a truncated file behind.
         
         Args:
         -----
             real_file_id: ID of the file to download
+            download_dir: the local directory where the file is saved
+            metadata: optional; metadata `dict` the caller already has for this file,
+                    e.g. an entry of `get_filelist()`. If it has 'name' and 'mimeType'
+                    no extra metadata request is made before the download.
+            chunk_size: number of bytes requested per chunk
+            return_bytes: if `True` the content is also returned as `bytes`. This is
+                    only allowed for files of at most `MAX_IN_MEMORY_SIZE` bytes.
+            print_status: if `True` the download progress is printed
 
         Returns:
         -------
-             IO object with location. which can be saved to the local dir by
-                        ```
-                            with open(filename, 'wb') as f:
-                                f.write(img)
-                        ```
+            `Path` of the downloaded file, or its content as `bytes` if `return_bytes` is `True`
         """
+        download_dir = Path(download_dir)
+
+        # create drive api client
+        service = self.service
+
+        file_id = real_file_id
+
+        if metadata is None or not {'name', 'mimeType'} <= metadata.keys():
+            metadata = self.get_metadata(file_id=file_id)
+
+        file_name = metadata['name']
+        mimetype = metadata['mimeType']
+
+        if return_bytes and int(metadata.get('size', 0)) > self.MAX_IN_MEMORY_SIZE:
+            raise ValueError(
+                f"`{file_name}` is larger than {self.MAX_IN_MEMORY_SIZE} bytes; download it with `return_bytes=False`."
+            )
+
+        # pylint: disable=maybe-no-member
+        if mimetype in self.EXPORT_MIMETYPES:
+            request = service.files().export_media(fileId=file_id, mimeType=self.EXPORT_MIMETYPES[mimetype])
+        else:
+            request = service.files().get_media(fileId=file_id)
+
+        filepath = download_dir / file_name
+        fd, temp_path = tempfile.mkstemp(prefix=f".{file_name}.", suffix='.part', dir=download_dir)
 
         try:
-            # create drive api client
-            service = self.service
-
-            file_id = real_file_id
-            file_name = self.get_filename(file_id=file_id)
-            mimetype = self.get_mimetype(file_id=file_id)
-
-            # pylint: disable=maybe-no-member
-            if mimetype is None:
-                request = service.files().get_media(fileId=file_id)
-            elif mimetype in [self.MIMETYPES['gdoc'], self.MIMETYPES['gsheet'], self.MIMETYPES['gslide'], self.MIMETYPES['gform']]:
-
-                if mimetype == self.MIMETYPES['gdoc']:
-                    mimetype = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-                elif mimetype == self.MIMETYPES['gsheet']:
-                    mimetype = "text/csv" # you can change it to "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet" also
-                elif mimetype == self.MIMETYPES['gslide']:
-                    mimetype = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
-                elif mimetype == self.MIMETYPES['gform']:
-                    mimetype = "application/vnd.google-apps.script+json"
-
-                request = service.files().export_media(fileId=file_id, mimeType=mimetype)
+            with os.fdopen(fd, 'wb') as file:
+                downloader = MediaIoBaseDownload(file, request, chunksize=chunk_size)
+                done = False
+                while done is False:
+                    # A failed chunk is requested again from the same offset
+                    status, done = self.executor.call(downloader.next_chunk)
+                    if print_status:
+                        print(f'Download {int(status.progress() * 100)}.')
+
+            os.replace(temp_path, filepath)
+
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        if return_bytes:
+            if filepath.stat().st_size > self.MAX_IN_MEMORY_SIZE:
+                raise ValueError(
+                    f"`{file_name}` is larger than {self.MAX_IN_MEMORY_SIZE} bytes; it was saved to `{filepath}`."
+                )
+            return filepath.read_bytes()
+
+        return filepath
+
+
+    def download_folder(self, cloud_dir_id:str, local_dir=Path.cwd(), max_workers:int=4, print_status=True):
+        """
+        Downloads every file of the Drive folder `cloud_dir_id` into `local_dir`.
+
+        The folder is listed once and the files are downloaded through a pool of
+        `max_workers` threads, each with a Drive service of its own. Files whose
+        local copy already has the same size and md5 checksum are skipped.
+        Sub-folders are not descended into.
+
+        Returns:
+        --------
+            `dict`: a report with keys
+                'downloaded': `list` of filenames downloaded
+                'skipped': `list` of filenames already up to date
+                'failed': `dict` filename -> error
+                'bytes': `int` number of bytes downloaded
+                'seconds': `float` wall-clock time taken
+                'throughput': `float` bytes per second
+        """
+        local_dir = Path(local_dir)
+        local_dir.mkdir(parents=True, exist_ok=True)
+
+        report = {'downloaded': [], 'skipped': [], 'failed': {}, 'bytes': 0}
+        start = time.perf_counter()
+
+        to_download = []
+        for file in self.iter_files(directory_id=cloud_dir_id, fields=self.METADATA_FIELDS):
+            if file['mimeType'] == self.FOLDER_MIMETYPE:
+                continue
+
+            local_file = local_dir / file['name']
+            if (
+                'md5Checksum' in file
+                and local_file.is_file()
+                and local_file.stat().st_size == int(file.get('size', -1))
+                and self.md5_checksum(local_file) == file['md5Checksum']
+            ):
+                report['skipped'].append(file['name'])
             else:
-                request = service.files().get_media(fileId=file_id)
+                to_download.append(file)
+
+        def download(file):
+            drive = self._worker_drive()
+            return drive.download_file(file['id'], download_dir=local_dir, metadata=file, print_status=False)
 
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(download, file): file for file in to_download}
 
-            file = io.BytesIO()
-            downloader = MediaIoBaseDownload(file, request)
-            done = False
-            while done is False:
-                status, done = downloader.next_chunk()
-                print(f'Download {int(status.progress() * 100)}.')
+            for future in as_completed(futures):
+                file = futures[future]
+                try:
+                    filepath = future.result()
+                except Exception as error:
+                    report['failed'][file['name']] = error
+                    continue
 
-        except HttpError as error:
-            print(f'An error occurred: {error}')
-            file = None
+                report['downloaded'].append(file['name'])
+                report['bytes'] += filepath.stat().st_size
 
-        iofileObj = file.getvalue()
+        report['seconds'] = time.perf_counter() - start
+        report['throughput'] = report['bytes'] / report['seconds'] if report['seconds'] > 0 else 0.0
 
-        self.save_file(iofileObj=iofileObj, filename=file_name, download_dir=download_dir)
+        if print_status:
+            print(
+                f"  Downloaded {len(report['downloaded'])} file(s), skipped {len(report['skipped'])}, "
+                f"failed {len(report['failed'])}\n"
+                f"  {report['bytes'] / 1e6:.2f} MB in {report['seconds']:.2f} s "
+                f"({report['throughput'] / 1e6:.2f} MB/s)\n"
+            )
 
-        return iofileObj
+        return report
 
 
     def rename_file(self, file_id:str, new_filename:str, print_status=True):
@@ -545,24 +1393,80 @@ class GoogleDrive:
             None
         """
 
-        try:
-            service = self.service
+        service = self.service
 
-            # File metadata
-            file_metadata = {
-                'name': new_filename,
-                'mimeType': self.get_mimetype(file_id=file_id)
-            }
+        # File metadata; fields left out of the body (e.g. `mimeType`) are kept as they are
+        file_metadata = {
+            'name': new_filename
+        }
+
+        # Send the request to the API.
+        self.executor.execute(service.files().update(fileId=file_id, body=file_metadata, fields='id'))
+
+        if print_status:
+            print(f"\nFile renamed to `{new_filename}`\n")
+
+
+
+    def batch_get_metadata(self, file_ids:list, fields:str=METADATA_FIELDS):
+        """
+        Fetches the metadata of many files with batched requests (see `execute_batch()`)
+
+        Returns:
+        --------
+            `(results, errors)`: `dict`s file_id -> metadata `dict` / `GoogleAPIError`
+        """
+        return execute_batch(
+            self.service,
+            {file_id: lambda file_id=file_id: self.service.files().get(fileId=file_id, fields=fields) for file_id in file_ids},
+            batch_size=self.BATCH_SIZE,
+            executor=self.executor
+        )
+
+
+    def batch_rename(self, new_filenames:dict):
+        """
+        Renames many files with batched requests (see `execute_batch()`)
+
+        Parameter:
+        ----------
+            `new_filenames`: `dict` file_id -> new filename
+
+        Returns:
+        --------
+            `(results, errors)`: `dict`s file_id -> response / `GoogleAPIError`
+        """
+        return execute_batch(
+            self.service,
+            {
+                file_id: lambda file_id=file_id, name=name: self.service.files().update(
+                    fileId=file_id, body={'name': name}, fields='id, name'
+                )
+                for file_id, name in new_filenames.items()
+            },
+            batch_size=self.BATCH_SIZE,
+            executor=self.executor
+        )
 
-            # Send the request to the API.
-            service.files().update(fileId=file_id, body=file_metadata).execute()
 
-            if print_status:
-                print(f"\nFile renamed to `{new_filename}`\n")
+    def batch_delete(self, file_ids:list):
+        """
+        Permanently deletes many files, skipping the trash, with batched requests (see `execute_batch()`)
 
-        except HttpError as error:
-            print(f'An error occurred: {error}')
+        A delete is not retried after a failure it may have succeeded despite (a
+        5xx or a time out), since the repeated delete would report a deleted file as `NotFound`.
 
+        Returns:
+        --------
+            `(results, errors)`: `dict`s file_id -> response / `GoogleAPIError`
+        """
+        return execute_batch(
+            self.service,
+            {file_id: lambda file_id=file_id: self.service.files().delete(fileId=file_id) for file_id in file_ids},
+            batch_size=self.BATCH_SIZE,
+            executor=self.executor,
+            idempotent=False
+        )
 
 
     def create_folder(self, folder_name:str, parent_dir_id=None, parent_dir_name=None, print_status=True):
@@ -580,45 +1484,40 @@ class GoogleDrive:
             `id` of the dir created
         """
 
-        try:
-            service = self.service
-
-            if parent_dir_id is None and parent_dir_name is None:
-                
-                # dir_id = "Base Google Drive directory"
-                parents = []
-
-            elif parent_dir_id is not None and parent_dir_name is None:
-                dir_id = parent_dir_id
-                parents = [dir_id]
+        service = self.service
 
-            elif parent_dir_id is None and parent_dir_name is not None:
-                parents = [self.get_directory_id(dir_name=parent_dir_name)]
+        if parent_dir_id is None and parent_dir_name is None:
+            
+            # dir_id = "Base Google Drive directory"
+            parents = []
 
-            else:
-                dir_id = self.get_directory_id(dir_name=parent_dir_name)
+        elif parent_dir_id is not None and parent_dir_name is None:
+            dir_id = parent_dir_id
+            parents = [dir_id]
 
-                if dir_id == parent_dir_id:
-                    parents = [dir_id]
-                else:
-                    raise NotImplementedError("Given cloud directory name and cloud directory id don't match!")
+        elif parent_dir_id is None and parent_dir_name is not None:
+            parents = [self.get_directory_id(dir_name=parent_dir_name)]
 
+        else:
+            dir_id = self.get_directory_id(dir_name=parent_dir_name)
 
-            new_dir_metadata = {
-                        "name": folder_name,
-                        "parents": parents,
-                        "mimeType": 'application/vnd.google-apps.folder'
-                    }
-            new_cloud_dir = service.files().create(body=new_dir_metadata, fields="id").execute()
+            if dir_id == parent_dir_id:
+                parents = [dir_id]
+            else:
+                raise NotImplementedError("Given cloud directory name and cloud directory id don't match!")
 
-            if print_status:
-                print("Directory Created successfully!")
 
-            return new_cloud_dir.get('id')
+        new_dir_metadata = {
+                    "name": folder_name,
+                    "parents": parents,
+                    "mimeType": 'application/vnd.google-apps.folder'
+                }
+        new_cloud_dir = self.executor.execute(service.files().create(body=new_dir_metadata, fields="id"), idempotent=False)
 
+        if print_status:
+            print("Directory Created successfully!")
 
-        except HttpError as err:
-            print(f'ERROR: {err}')
+        return new_cloud_dir.get('id')
 
 
     def delete_file(self, file_id):
@@ -628,43 +1527,32 @@ class GoogleDrive:
           service: Drive API service instance.
           file_id: ID of the file to delete.
         """
-        try:
-            service = self.service
-            service.files().delete(fileId=file_id).execute()
-            print("File deleted permanently!")
-
-        except HttpError as err:
-            print(f'ERROR: {err}')
+        service = self.service
+        self.executor.execute(service.files().delete(fileId=file_id))
+        print("File deleted permanently!")
 
 
     def create_blank_googlesheet(self, spreadsheet_name:str='Untitled', parent_dir_id:str=None):
         
-        try:
-            service = self.service
+        service = self.service
 
-            if parent_dir_id is None:
-                # dir_id = "Base Google Drive directory"
-                parents = []
+        if parent_dir_id is None:
+            # dir_id = "Base Google Drive directory"
+            parents = []
 
-            else:
-                dir_id = parent_dir_id
-                parents = [dir_id]
-
-            sheet_metadata = {
-                "name": spreadsheet_name,
-                "mimeType": 'application/vnd.google-apps.spreadsheet',
-                "parents": parents
-            }
-
-            file = service.files().create(body=sheet_metadata, fields="id").execute()
-            file_id = file.get('id')
+        else:
+            dir_id = parent_dir_id
+            parents = [dir_id]
 
-        except HttpError as err:
-            print(f'ERROR: {err}')
-            file_id = None
+        sheet_metadata = {
+            "name": spreadsheet_name,
+            "mimeType": 'application/vnd.google-apps.spreadsheet',
+            "parents": parents
+        }
 
+        file = self.executor.execute(service.files().create(body=sheet_metadata, fields="id"), idempotent=False)
         
-        return file_id
+        return file.get('id')
 
 
 class GmailMessage(EmailMessage):
@@ -687,18 +1575,37 @@ class GmailMessage(EmailMessage):
         self.gmail_message = {'raw': raw}
 
 
-    def send(self):
-        try:
-            gmail_client = GoogleClient(client='gmail')
-            service = gmail_client.service
+    def send(self, service=None, executor:RequestExecutor=None, print_status:bool=True):
+        """
+        Sends the message from the authorized Gmail account
+
+        Parameters:
+        -----------
+            `service`: optional; an already built Gmail service to send through
+                    (e.g. the one of a bulk sending worker), defaults to the
+                    calling thread's service of `GoogleClientRegistry`
+            `executor`: optional; the `RequestExecutor` sending the message,
+                    defaults to the process-wide Gmail executor
+            `print_status`: `bool`; print the id of the sent message
+
+        Returns:
+        --------
+            `dict`: the sent message resource, e.g. {'id': ..., 'threadId': ..., 'labelIds': [...]}
+        """
+        if service is None:
+            service = GoogleClient(client='gmail').service
 
-            send_message = (service.users().messages().send
-                            (userId="me", body=self.gmail_message).execute())
+        executor = GoogleClientRegistry.get_executor('gmail') if executor is None else executor
+
+        send_message = executor.execute(
+            service.users().messages().send(userId="me", body=self.gmail_message),
+            idempotent=False
+        )
+
+        if print_status:
             print(f'Message Id: {send_message["id"]}')
 
-        except HttpError as error:
-            print(F'An error occurred: {error}')
-            send_message = None
+        return send_message
 
 
 class Gmail:
@@ -711,58 +1618,353 @@ class Gmail:
     Date: Aug 28, 2022
     """
 
-    def __init__(self):
+    # Messages fetched per batch HTTP request; Gmail throttles batches of more than 50
+    BATCH_SIZE = 50
 
-        # create drive api client
-        gmail = GoogleClient(client='gmail')
-        self.service = gmail.service
+    # What a metadata-only fetch asks for: just the headers `_parse_message` reads, no body
+    METADATA_HEADERS = ['Subject', 'From']
+    METADATA_FIELDS = "id, threadId, payload/headers"
 
+    # Sending costs 100 quota units of the 15,000 per user per minute, i.e. at most
+    # 2.5 messages per second; this limiter is shared by every sender of the process
+    SEND_LIMITER = RateLimiter(rate=2, capacity=5)
 
-    def get_messages(self):
+    def __init__(self, service=None, executor:RequestExecutor=None, store=None, service_factory=None):
         """
-        Functions to print the mailbox
+        Parameters
+        ----------
+            `service`: optional; an already built Gmail service (e.g. a fake one for testing)
+            `executor`: optional; the `RequestExecutor` running every API call, defaults
+                    to the process-wide Gmail executor of `GoogleClientRegistry`
+            `store`: optional; a `GmailStore` from which `inbox()` reads (see `enable_store()`)
+            `service_factory`: optional; a callable returning a new Gmail service. It is used
+                    to give every worker thread of `send_many()` its own service, since
+                    `googleapiclient` services are not thread-safe.
         """
-        result = self.service.users().messages().list(userId='me').execute()
 
-        messages = result.get('messages') # messages is a list of dictionaries where each dictionary contains a message id.
+        self.credentials = None
+
+        if service is None:
+            # create gmail api client
+            gmail = GoogleClient(client='gmail')
+            service = gmail.service
+            self.credentials = gmail.credentials
 
-        return messages
+        self.service = service
+        self.executor = GoogleClientRegistry.get_executor('gmail') if executor is None else executor
+        self.store = store
+        self.service_factory = service_factory
+        self._local = threading.local()
 
 
-    def get_email_message(self, message_id):
+    def _worker_service(self):
+        """The Gmail service of the calling worker thread, built once per thread"""
+        return GoogleClientRegistry.get_worker_service(
+            'gmail', self._local, service_factory=self.service_factory, credentials=self.credentials
+        )
+
+
+    def send_many(self, messages:dict, max_workers:int=4, retries:int=2, print_status:bool=True):
         """
+        Sends many messages through a bounded pool of worker threads, each with
+        a Gmail service of its own, while `SEND_LIMITER` keeps the process within
+        the Gmail send quota.
+
+        A send is not idempotent, so only a failure that certainly delivered
+        nothing (rate limited, or the connection refused) is sent again, in up
+        to `retries` more rounds. A message that failed otherwise (e.g. a time
+        out, which may still have been delivered) is reported as failed.
+        Any error of a single message is recorded and never aborts the others.
+
+        Parameters:
+        -----------
+            `messages`: `dict` key (e.g. the recipient) -> `GmailMessage`
+            `max_workers`: `int`; number of messages sent concurrently
+            `retries`: `int`; rounds of resending the failures safe to resend
+            `print_status`: `bool`; print a line per message
+
         Returns:
         --------
-            `subject`, `sender`, `body`
+            `dict`: key -> {'to': [...], 'status': 'sent' / 'failed', 'id': sent message id
+                    or `None`, 'error': the last exception or `None`, 'attempts': `int`}
         """
+        report = {
+            key: {'to': msg.to, 'status': 'failed', 'id': None, 'error': None, 'attempts': 0}
+            for key, msg in messages.items()
+        }
+
+        def send(key):
+            service = self._worker_service()
+            self.SEND_LIMITER.acquire()
+            report[key]['attempts'] += 1
+            return messages[key].send(service=service, executor=self.executor, print_status=False)
+
+        pending = list(messages)
+
+        for attempt in range(retries + 1):
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = {pool.submit(send, key): key for key in pending}
+
+                for future in as_completed(futures):
+                    key = futures[future]
+                    try:
+                        sent = future.result()
+                    except Exception as e:
+                        report[key].update(status='failed', error=e)
+                    else:
+                        report[key].update(status='sent', id=sent['id'], error=None)
+
+                    if print_status:
+                        print(f"{', '.join(report[key]['to'])}: {report[key]['status']}"
+                              + (f" ({report[key]['error']})" if report[key]['error'] else ""))
+
+            pending = [key for key in pending if self._is_safe_to_resend(report[key]['error'])]
+            if not pending:
+                break
 
-        msg = self.service.users().messages().get(userId='me', id=message_id).execute()
+        return report
+
+
+    @staticmethod
+    def _is_safe_to_resend(error:Exception):
+        """Whether a send that failed with `error` certainly delivered nothing"""
+        if error is None:
+            return False
+        if isinstance(error, RateLimitExceeded):
+            return True
+        return RequestExecutor.is_safe_to_resend(error.__cause__ or error)
+
+
+    def enable_store(self, path=GmailStore.DEFAULT_PATH, label_id:str='INBOX'):
+        """
+        Attaches a local `GmailStore` of the label `label_id` to this account.
+        Afterwards `inbox()` only fetches the messages that arrived since its
+        previous call (through `historyId`) and reads everything else locally.
+
+        Returns
+        -------
+            `GmailStore`
+        """
+        self.store = GmailStore(gmail=self, path=path, label_id=label_id)
+
+        return self.store
+
+
+    def iter_messages(self, query:str=None, max_results:int=None, page_size:int=500, label_ids:list=None):
+        """
+        Iterates over the ids of the mailbox messages (newest first), following
+        `nextPageToken` until every page, or `max_results` messages, are read.
+
+        Parameters:
+        -----------
+            `query`: optional; a Gmail search query, e.g. 'subject:symposium after:2024/12/01'
+            `max_results`: optional; `int` stop after this many messages
+            `page_size`: `int` messages per `messages().list` call (at most 500)
+            `label_ids`: optional; `list` of label ids (e.g. ['INBOX', 'Label_12']), only
+                    messages carrying all of them are listed
+
+        Yields:
+        -------
+            `dict`: e.g. {'id': '18c9...', 'threadId': '18c9...'}
+        """
+        page_token = None
+        count = 0
+
+        while True:
+            if max_results is not None:
+                page_size = min(page_size, max_results - count)
+
+            result = self.executor.execute(self.service.users().messages().list(
+                userId='me',
+                q=query,
+                labelIds=label_ids,
+                maxResults=page_size,
+                pageToken=page_token,
+                fields="nextPageToken, messages(id, threadId)"
+            ))
+
+            for message in result.get('messages', []):
+                yield message
+                count += 1
+
+            page_token = result.get('nextPageToken')
+            if page_token is None or (max_results is not None and count >= max_results):
+                break
+
+
+    def get_messages(self, query:str=None, max_results:int=None):
+        """
+        Returns:
+        --------
+            `list` of `dict`s, each containing a message id (see `iter_messages()`)
+        """
+        return list(self.iter_messages(query=query, max_results=max_results))
+
+
+    def _get_request(self, message_id, metadata_only:bool=False):
+        """The `messages().get` request of a message; only its headers if `metadata_only`"""
+        if metadata_only:
+            return self.service.users().messages().get(
+                userId='me',
+                id=message_id,
+                format='metadata',
+                metadataHeaders=self.METADATA_HEADERS,
+                fields=self.METADATA_FIELDS
+            )
+
+        return self.service.users().messages().get(userId='me', id=message_id)
+
+
+    @staticmethod
+    def _decode_part(part:dict):
+        """The text of a single MIME part of a message payload, `None` if it has no inline data"""
+        data = part.get('body', {}).get('data')
+        if data is None:
+            return None
+
+        charset = 'utf-8'
+        for header in part.get('headers', []):
+            if header['name'].lower() == 'content-type':
+                match = re.search(r'charset="?([\w.:-]+)"?', header['value'], re.IGNORECASE)
+                if match:
+                    charset = match.group(1)
+                break
+
+        # Gmail sends unpadded URL-safe base64
+        raw = base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+        try:
+            return raw.decode(charset, errors='replace')
+        except LookupError: # unknown charset
+            return raw.decode('utf-8', errors='replace')
+
+
+    @staticmethod
+    def html_to_text(html:str):
+        """The visible text of an HTML body (imports BeautifulSoup only when needed)"""
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(html, "lxml").get_text("\n", strip=True)
+
+
+    @staticmethod
+    def extract_body(payload:dict):
+        """
+        The text body of a message payload.
+
+        The MIME tree is walked depth first (single part, multipart/alternative,
+        nested multipart/mixed, ...), attachments are skipped, and the first
+        text/plain part wins. Only if there is none is the first text/html part
+        converted to text.
+
+        Returns:
+        --------
+            `str`, or `None` if the message has no text part
+        """
+        html_part = None
+        stack = [payload]
+
+        while stack:
+            part = stack.pop()
+            mimetype = part.get('mimeType', '')
+
+            if mimetype.startswith('multipart/'):
+                stack.extend(reversed(part.get('parts', [])))
+                continue
+
+            if part.get('filename'):
+                continue
+
+            if mimetype == 'text/plain':
+                text = Gmail._decode_part(part)
+                if text is not None:
+                    return text
+            elif mimetype == 'text/html' and html_part is None:
+                html_part = part
+
+        if html_part is not None:
+            html = Gmail._decode_part(html_part)
+            if html is not None:
+                return Gmail.html_to_text(html)
+
+        return None
+
+
+    @staticmethod
+    def _parse_message(msg:dict):
+        """
+        `subject`, `sender`, `body` of a `messages().get` resource;
+        `body` is `None` for a metadata-only resource.
+        """
 
         # Get value of 'payload' from dictionary `msg`
         payload = msg['payload']
         headers = payload['headers']
 
         # Look for Subject and Sender Email in the headers
+        subject = sender = ''
         for d in headers:
             if d['name'] == 'Subject':
                 subject = d['value']
             if d['name'] == 'From':
                 sender = d['value']
 
-        # The Body of the message is in Encrypted format. So, we have to decode it.
-        # Get the data and decode it with base 64 decoder.
-        parts = payload.get('parts')[0]
-        data = parts['body']['data']
-        data = data.replace("-","+").replace("_","/")
-        decoded_data = base64.b64decode(data)
+        if 'parts' not in payload and 'body' not in payload:
+            return subject, sender, None
 
+        return subject, sender, Gmail.extract_body(payload)
 
-        # Now, the data obtained is in lxml. So, we will parse 
-        # it with BeautifulSoup library
-        soup = BeautifulSoup(decoded_data , "lxml")
-        body = soup.body()
 
-        return subject, sender, body
+    def get_email_message(self, message_id, metadata_only:bool=False):
+        """
+        Parameters:
+        -----------
+            `message_id`: `str`
+            `metadata_only`: `bool`; fetch only the `METADATA_HEADERS` (`body` is then `None`),
+                    which moves a small fraction of the bytes of a full message
+
+        Returns:
+        --------
+            `subject`, `sender`, `body`
+        """
+
+        msg = self.executor.execute(self._get_request(message_id, metadata_only=metadata_only))
+
+        return self._parse_message(msg)
+
+
+    def get_message_resources(self, message_ids:list, metadata_only:bool=False):
+        """
+        Fetches many message resources through batch HTTP requests, `BATCH_SIZE` per round trip
+        (only their headers if `metadata_only`, see `get_email_message()`)
+
+        Returns:
+        --------
+            `(resources, errors)`: `dict`s keyed by message id of the `messages().get`
+                    resource of every fetched message and of the `GoogleAPIError` of every failed one
+        """
+        return execute_batch(
+            self.service,
+            {
+                message_id: (lambda message_id=message_id: self._get_request(message_id, metadata_only=metadata_only))
+                for message_id in message_ids
+            },
+            batch_size=self.BATCH_SIZE,
+            executor=self.executor
+        )
+
+
+    def get_email_messages(self, message_ids:list, metadata_only:bool=False):
+        """
+        Fetches many messages through batch HTTP requests (see `get_message_resources()`)
+
+        Returns:
+        --------
+            `(messages, errors)`: `dict`s keyed by message id of the
+                    (`subject`, `sender`, `body`) of every fetched message
+                    and of the `GoogleAPIError` of every failed one
+        """
+        results, errors = self.get_message_resources(message_ids, metadata_only=metadata_only)
+
+        return {message_id: self._parse_message(msg) for message_id, msg in results.items()}, errors
 
 
     @staticmethod
@@ -782,13 +1984,29 @@ class Gmail:
         print('\n')
 
 
-    def inbox(self, num_of_emails=5, print_body=False):
+    def inbox(self, num_of_emails=5, print_body=False, query:str=None):
+        """
+        Prints the latest `num_of_emails` messages (matching `query`, e.g. 'subject:symposium')
 
-        messages = self.get_messages()
+        With a store attached (see `enable_store()`) and no `query`, the store is
+        synced and the messages are read from it.
+        """
+        if self.store is not None and query is None:
+            self.store.sync()
+            for msg in self.store.messages(limit=num_of_emails):
+                self.print_email_message(msg['subject'], msg['sender'], msg['body'] if print_body else None)
+            return
+
+        message_ids = [el['id'] for el in self.iter_messages(query=query, max_results=num_of_emails)]
+        # Without the body only the headers are needed
+        messages, errors = self.get_email_messages(message_ids, metadata_only=not print_body)
 
-        for el in messages[:num_of_emails + 1]:
-            msg_id = el['id']
-            sub, sender, body = self.get_email_message(message_id=msg_id)
+        for msg_id in message_ids:
+            if msg_id in errors:
+                print(f"Could not fetch the message {msg_id}: {errors[msg_id]}")
+                continue
+
+            sub, sender, body = messages[msg_id]
 
             if not print_body:
                 body = None
@@ -797,6 +2015,101 @@ class Gmail:
 
 
 
+A1_CELL_PATTERN = re.compile(r"^\$?([A-Za-z]+)\$?(\d+)$")
+A1_REF_PATTERN = re.compile(r"^\$?([A-Za-z]{0,3})\$?(\d*)$") # a cell, a column ('C') or a row ('5'); at most column 'ZZZ'
+
+
+def column_letter(col:int):
+    """1 -> 'A', 26 -> 'Z', 27 -> 'AA'"""
+    letters = ''
+    while col > 0:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def a1_to_rowcol(cell:str):
+    """
+    'B3' -> (3, 2); rows and columns start from 1
+
+    Raises `CellNotFound` if `cell` is not a single cell in A1 notation.
+    """
+    match = A1_CELL_PATTERN.match(cell.strip())
+    if match is None:
+        raise CellNotFound(f"`{cell}` is not a cell in A1 notation.")
+
+    letters, row = match.groups()
+
+    return int(row), _column_number(letters)
+
+
+def _column_number(letters:str):
+    col = 0
+    for letter in letters.upper():
+        col = col * 26 + ord(letter) - ord('A') + 1
+    return col
+
+
+def a1_range_bounds(a1:str):
+    """
+    The (top, left, bottom, right) rows and columns (starting from 1) of a range
+    in A1 notation without sheet name; `bottom` / `right` are `None` where the
+    range is open:
+
+        'B2:D5' -> (2, 2, 5, 4)         'B3' -> (3, 2, 3, 2)
+        'A:C'   -> (1, 1, None, 3)      'A2:C' -> (2, 1, None, 3)
+        '2:5'   -> (2, 1, 5, None)      ''   -> (1, 1, None, None)
+
+    Raises `CellNotFound` if `a1` is not a range in A1 notation (e.g. a sheet name
+    such as 'Sheet1' or 'Data': a sheet has at most the columns 'A' to 'ZZZ').
+    """
+    if not a1.strip():
+        return 1, 1, None, None
+
+    refs = []
+    for ref in a1.split(':'):
+        match = A1_REF_PATTERN.match(ref.strip())
+        if match is None or not any(match.groups()) or len(refs) == 2:
+            raise CellNotFound(f"`{a1}` is not a range in A1 notation.")
+        letters, row = match.groups()
+        refs.append((int(row) if row else None, _column_number(letters) if letters else None))
+
+    (top, left), (bottom, right) = refs[0], refs[-1]
+
+    if len(refs) == 1 and (top is None or left is None):
+        # A lone column ('C') or row ('5') is the whole column or row
+        return top or 1, left or 1, top, left
+
+    return top or 1, left or 1, bottom, right
+
+
+def is_a1_range(a1:str):
+    """Whether `a1` is a range in A1 notation (see `a1_range_bounds()`)"""
+    try:
+        a1_range_bounds(a1)
+    except CellNotFound:
+        return False
+    return True
+
+
+def rowcol_to_a1(row:int, col:int):
+    """(3, 2) -> 'B3'"""
+    return f"{column_letter(col)}{row}"
+
+
+def split_sheet_range(range_:str):
+    """
+    'Sheet 1!A1:B2' -> ('Sheet 1!', 'A1:B2'); 'A1:B2' -> ('', 'A1:B2')
+    """
+    sheet, separator, a1 = range_.rpartition('!')
+    return (sheet + separator, a1)
+
+
+def quote_sheet_title(title:str):
+    """'Form Responses 1' -> "'Form Responses 1'", as a range prefix of the API expects it"""
+    return "'" + title.replace("'", "''") + "'"
+
+
 class GoogleSheetClient(GoogleClient, GoogleServiceAccountClient):
     """
     A class representing a GoogleSheetClient
@@ -814,6 +2127,9 @@ class GoogleSheetClient(GoogleClient, GoogleServiceAccountClient):
         else:
             GoogleServiceAccountClient.__init__(self, client='sheet')
 
+        # Every call of this client (and of its `GoogleSheet`s) goes through this executor
+        self.executor = GoogleClientRegistry.get_executor('sheet')
+
 
     def create_spreadsheet(
         self,
@@ -848,7 +2164,7 @@ class GoogleSheetClient(GoogleClient, GoogleServiceAccountClient):
             ]
         }
 
-        gsheet = self.service.spreadsheets().create(body=spreadsheet_body).execute()
+        gsheet = self.executor.execute(self.service.spreadsheets().create(body=spreadsheet_body), idempotent=False)
         
         pprint(gsheet)
 
@@ -873,13 +2189,46 @@ class GoogleSheet:
     Date: Nov 15, 2022
     """
 
-    def __init__(self, client:GoogleSheetClient, spreadsheet_id:str):
+    # Only the metadata this class uses; the full `spreadsheets().get` payload
+    # also carries every sheet's merges, filters, charts, conditional formats...
+    METADATA_FIELDS = "spreadsheetId,spreadsheetUrl,properties,sheets.properties"
+
+    # batchUpdate requests which do not change the cached metadata (all other
+    # kinds without an in-place update in `_apply_replies()` invalidate the cache)
+    METADATA_NEUTRAL_REQUESTS = {
+        'updateCells', 'repeatCell', 'mergeCells', 'unmergeCells', 'updateBorders',
+        'updateDimensionProperties', 'autoResizeDimensions', 'setDataValidation',
+        'addConditionalFormatRule', 'updateConditionalFormatRule', 'deleteConditionalFormatRule',
+        'sortRange', 'setBasicFilter', 'clearBasicFilter', 'findReplace',
+        'addNamedRange', 'updateNamedRange', 'deleteNamedRange',
+        'addProtectedRange', 'updateProtectedRange', 'deleteProtectedRange',
+        'updateChartSpec'
+    }
+
+    # Limits keeping `batch_get()` / `batch_update()` requests well within what the API accepts
+    BATCH_GET_MAX_RANGES = 100
+    BATCH_GET_MAX_URL_LENGTH = 8000 # characters of `ranges=` query parameters per request
+    BATCH_UPDATE_MAX_BYTES = 1024 * 1024 # JSON size of the values per request
+
+    def __init__(self, client:GoogleSheetClient, spreadsheet_id:str, metadata:dict=None):
+        """
+        Parameters:
+        -----------
+            `metadata`: optional; a spreadsheet resource the caller already has
+                    (e.g. the response of `spreadsheets().create`), used instead of fetching it
+        """
 
         self.client = client
         self.id = spreadsheet_id
         self.service = client.service
+        self.executor = client.executor
+
+        self._metadata = metadata
+        self._lookup = None # (by id, by title, by index) maps of the sheet properties; see `_sheet_lookup()`
+        self._worksheets = {} # sheetId -> memoized `Worksheet`
 
-        self.set_properties()
+        if self._metadata is None:
+            self.set_properties()
 
 
     def __repr__(self):
@@ -893,9 +2242,58 @@ class GoogleSheet:
         """Sets up basic properties"""
         # The following gives a `dict` with keys: dict_keys(['spreadsheetId', 'properties', 'sheets', 'spreadsheetUrl'])
         # using this `dict` we can create GoogleSheet object
-        self.spreadsheet = self.service.spreadsheets().get(spreadsheetId=self.id).execute()
-        self._properties = self.spreadsheet['properties'] # dict
-        self._sheets = self.spreadsheet['sheets'] # list
+        self._metadata = self.executor.execute(
+            self.service.spreadsheets().get(spreadsheetId=self.id, fields=self.METADATA_FIELDS)
+        )
+        self._lookup = None
+
+    def invalidate_metadata(self):
+        """Drops the cached metadata; it is fetched again the next time it is needed"""
+        self._metadata = None
+        self._lookup = None
+
+    def _sheet_lookup(self):
+        """
+        Returns the maps (sheetId -> properties, title -> properties, [properties by index])
+        of the cached metadata, rebuilding them only after the metadata has changed.
+        """
+        if self._lookup is None:
+            by_index = sorted((sheet['properties'] for sheet in self._sheets), key=lambda props: props['index'])
+            by_id = {props['sheetId']: props for props in by_index}
+            by_title = {props['title']: props for props in by_index}
+            self._lookup = (by_id, by_title, by_index)
+
+            # Keep the memoized worksheets pointing at the current properties
+            for sheet_id in list(self._worksheets):
+                if sheet_id in by_id:
+                    self._worksheets[sheet_id]._properties = by_id[sheet_id]
+                else:
+                    del self._worksheets[sheet_id]
+
+        return self._lookup
+
+    def _worksheet(self, properties:dict):
+        """The memoized `Worksheet` of the sheet with the given properties"""
+        worksheet = self._worksheets.get(properties['sheetId'])
+        if worksheet is None:
+            worksheet = Worksheet(self, properties)
+            self._worksheets[properties['sheetId']] = worksheet
+        return worksheet
+
+    @property
+    def spreadsheet(self):
+        """The cached spreadsheet metadata `dict` (fetched if it was invalidated)"""
+        if self._metadata is None:
+            self.set_properties()
+        return self._metadata
+
+    @property
+    def _properties(self):
+        return self.spreadsheet['properties'] # dict
+
+    @property
+    def _sheets(self):
+        return self.spreadsheet.setdefault('sheets', []) # list
 
     @property
     def title(self):
@@ -930,9 +2328,9 @@ class GoogleSheet:
         --------
             `list[Worksheet(), ... , Worksheet()]`
         """
-        wkshts = self.spreadsheet['sheets'] # `list` of `dict`
+        _, _, by_index = self._sheet_lookup()
 
-        return [Worksheet(self, wks['properties']) for wks in wkshts]
+        return [self._worksheet(properties) for properties in by_index]
 
 
     def get_worksheet(self, index):
@@ -951,10 +2349,12 @@ class GoogleSheet:
         >>> worksheet = sht.get_worksheet(2)
         """
 
+        _, _, by_index = self._sheet_lookup()
+
         try:
-            return self.worksheets()[index]
+            return self._worksheet(by_index[index])
 
-        except (KeyError, IndexError):
+        except (KeyError, IndexError, TypeError):
             raise GoogleSheetError("index {} not found".format(index))
 
 
@@ -970,12 +2370,12 @@ class GoogleSheet:
         --------
             `Worksheet()`
         """
-        for sheet in self._sheets:
-            if sheet['properties']['title'] == sheet_title:
-                sheet_index = sheet['properties']['index']
-                return self.get_worksheet(index=sheet_index)
+        _, by_title, _ = self._sheet_lookup()
+
+        if sheet_title not in by_title:
+            raise WorksheetNotFound(f"No worksheet with the title `{sheet_title}` found!")
 
-        raise WorksheetNotFound(f"No worksheet with the title `{sheet_title}` found!")
+        return self._worksheet(by_title[sheet_title])
 
     
     def has_worksheet_with_given_title(self, title:str):
@@ -990,8 +2390,8 @@ class GoogleSheet:
         --------
             `Bool`
         """
-        available_worksheet_titles = [sheet['properties']['title'] for sheet in self._sheets]
-        return title in available_worksheet_titles
+        _, by_title, _ = self._sheet_lookup()
+        return title in by_title
 
 
     def get(self, range_, majorDimension='ROWS'):
@@ -1015,11 +2415,11 @@ class GoogleSheet:
                 [['Timestamp']]
             
         """
-        response = self.service.spreadsheets().values().get(
+        response = self.executor.execute(self.service.spreadsheets().values().get(
             spreadsheetId=self.id,
             range=range_,
             majorDimension=majorDimension
-        ).execute()
+        ))
 
         return response['values']
 
@@ -1045,16 +2445,165 @@ class GoogleSheet:
             "values": values
         }
 
-        response = self.service.spreadsheets().values().update(
+        response = self.executor.execute(self.service.spreadsheets().values().update(
             spreadsheetId=self.id,
             range=range_,
             valueInputOption='USER_ENTERED',
             body=value_range_body
-        ).execute()
+        ))
 
         pprint(response)
 
 
+    def batch_get(self, ranges:list, majorDimension='ROWS'):
+        """
+        Gets the values of many ranges with `values().batchGet`.
+
+        The ranges are sent in as few requests as possible, each one staying within
+        `BATCH_GET_MAX_RANGES` ranges and `BATCH_GET_MAX_URL_LENGTH` characters of query string.
+
+        Parameter:
+        ----------
+            `ranges`: `list` of str in A1 notation
+
+        Returns:
+        --------
+            `dict`: range -> `list[list[], ... , list[]]` (an empty `list` for an empty range)
+
+        Example:
+        --------
+            >>> spreadsheet.batch_get(['Sheet 1!A1:B1', 'Sheet 1!D4'])
+                {'Sheet 1!A1:B1': [['Timestamp', 'Price (INR)']], 'Sheet 1!D4': [['42']]}
+        """
+        ranges = list(dict.fromkeys(ranges)) # drop repeated ranges, keep the order
+        results = {}
+
+        chunk = []
+        chunk_length = 0
+        chunks = []
+        for range_ in ranges:
+            length = len(quote(range_)) + len("&ranges=")
+            if chunk and (len(chunk) == self.BATCH_GET_MAX_RANGES or chunk_length + length > self.BATCH_GET_MAX_URL_LENGTH):
+                chunks.append(chunk)
+                chunk, chunk_length = [], 0
+            chunk.append(range_)
+            chunk_length += length
+        if chunk:
+            chunks.append(chunk)
+
+        for chunk in chunks:
+            response = self.executor.execute(self.service.spreadsheets().values().batchGet(
+                spreadsheetId=self.id,
+                ranges=chunk,
+                majorDimension=majorDimension
+            ))
+
+            # The value ranges come back in the order they were asked for
+            for range_, value_range in zip(chunk, response.get('valueRanges', [])):
+                results[range_] = value_range.get('values', [])
+
+        return results
+
+
+    @staticmethod
+    def _split_value_range(range_:str, values:list, max_bytes:int, sheet_titles=()):
+        """
+        Splits the update of `range_` into row blocks of at most about `max_bytes`
+        of JSON each. Every block is anchored at its own top left cell.
+
+        A `range_` without '!' which is one of `sheet_titles`, or not a range in
+        A1 notation at all, is a whole sheet (as the API reads it), e.g. 'Sheet1'.
+
+        Returns:
+        --------
+            `list` of (range, values)
+        """
+        size = len(json.dumps(values))
+        if size <= max_bytes or len(values) < 2:
+            return [(range_, values)]
+
+        sheet, a1 = split_sheet_range(range_)
+
+        if not sheet and (a1 in sheet_titles or not is_a1_range(a1)):
+            sheet, a1 = quote_sheet_title(a1) + '!', '' # the whole sheet starts at A1
+
+        start_row, start_col, _, _ = a1_range_bounds(a1) # 'A:C' starts at A1
+
+        rows_per_block = max(1, len(values) * max_bytes // size)
+        return [
+            (f"{sheet}{rowcol_to_a1(start_row + offset, start_col)}", values[offset:offset + rows_per_block])
+            for offset in range(0, len(values), rows_per_block)
+        ]
+
+
+    def batch_update(self, data:dict, value_input_option:str='USER_ENTERED'):
+        """
+        Updates the values of many ranges with `values().batchUpdate`.
+
+        The updates are grouped into requests of at most `BATCH_UPDATE_MAX_BYTES`
+        of ranges and values (the API sets no limit on the number of ranges); a
+        single range larger than that is split into row blocks.
+
+        Parameter:
+        ----------
+            `data`: `dict` range in A1 notation -> list[list[], ... ,list[]]
+
+        Returns:
+        --------
+            `dict`: range -> `UpdateValuesResponse` of that range (a `list` of them
+                    if the range had to be split)
+
+        Example:
+        --------
+            >>> spreadsheet.batch_update({'Sheet 1!A1:B1': [[1, 3]], 'Sheet 1!D4': [['done']]})
+        """
+        # (original range, range, values, size)
+        # A bare range may be a sheet title (only needed if the range must be split)
+        sheet_titles = ()
+        if any('!' not in range_ for range_ in data):
+            sheet_titles = {s['properties']['title'] for s in self.spreadsheet['sheets']}
+
+        pieces = []
+        for range_, values in data.items():
+            for piece_range, piece_values in self._split_value_range(range_, values, self.BATCH_UPDATE_MAX_BYTES, sheet_titles):
+                pieces.append((range_, piece_range, piece_values, len(piece_range) + len(json.dumps(piece_values))))
+
+        chunks = []
+        chunk = []
+        chunk_size = 0
+        for piece in pieces:
+            if chunk and chunk_size + piece[3] > self.BATCH_UPDATE_MAX_BYTES:
+                chunks.append(chunk)
+                chunk, chunk_size = [], 0
+            chunk.append(piece)
+            chunk_size += piece[3]
+        if chunk:
+            chunks.append(chunk)
+
+        results = {}
+        for chunk in chunks:
+            body = {
+                "valueInputOption": value_input_option,
+                "data": [
+                    {"range": piece_range, "majorDimension": 'ROWS', "values": values}
+                    for _, piece_range, values, _ in chunk
+                ]
+            }
+            response = self.executor.execute(self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.id,
+                body=body
+            ))
+
+            for (range_, _, _, _), update in zip(chunk, response.get('responses', [])):
+                if range_ in results:
+                    previous = results[range_]
+                    results[range_] = (previous if isinstance(previous, list) else [previous]) + [update]
+                else:
+                    results[range_] = update
+
+        return results
+
+
     def batch_requests_update(self, list_of_requests:list):
         """
         This function can handle one or more Requests for 
@@ -1081,12 +2630,107 @@ class GoogleSheet:
             spreadsheetId=self.id,
             body=batch_update_spreadsheet_request_body
         )
-        response = request.execute()
+        response = self.executor.execute(request)
 
-        self.set_properties()
+        self._apply_replies(list_of_requests, response.get('replies', []))
 
         pprint(response)
 
+        return response
+
+
+    def _sheet_properties(self, sheet_id:int):
+        """The cached properties `dict` of the sheet with id `sheet_id`"""
+        by_id, _, _ = self._sheet_lookup()
+        if sheet_id not in by_id:
+            raise WorksheetNotFound(f"No worksheet with the id `{sheet_id}` found!")
+        return by_id[sheet_id]
+
+
+    def _insert_sheet(self, properties:dict):
+        """Adds a new sheet to the cached metadata and shifts the indices after it"""
+        for sheet in self._sheets:
+            if sheet['properties']['index'] >= properties['index']:
+                sheet['properties']['index'] += 1
+        self._sheets.insert(properties['index'], {'properties': properties})
+
+
+    def _remove_sheet(self, sheet_id:int):
+        """Removes a sheet from the cached metadata and shifts the indices after it"""
+        properties = self._sheet_properties(sheet_id)
+        self._sheets[:] = [sheet for sheet in self._sheets if sheet['properties'] is not properties]
+        for sheet in self._sheets:
+            if sheet['properties']['index'] > properties['index']:
+                sheet['properties']['index'] -= 1
+
+
+    @staticmethod
+    def _set_fields(target:dict, source:dict, fields:str):
+        """Copies the comma separated (dotted) `fields` of `source` into `target`"""
+        for field in fields.split(','):
+            *path, last = field.strip().split('.')
+            src, dst = source, target
+            for key in path:
+                src = src.get(key, {})
+                dst = dst.setdefault(key, {})
+            if last in src:
+                dst[last] = src[last]
+            else:
+                dst.pop(last, None)
+
+
+    def _apply_replies(self, list_of_requests:list, replies:list):
+        """
+        Updates the cached metadata in place from a batchUpdate's requests and
+        their `replies`, instead of fetching the whole metadata again.
+        Requests whose effect can not be worked out invalidate the cache.
+        """
+        if self._metadata is None:
+            return
+
+        replies = list(replies) + [{}] * (len(list_of_requests) - len(replies))
+
+        for request, reply in zip(list_of_requests, replies):
+            (kind, body), = request.items()
+
+            if kind in self.METADATA_NEUTRAL_REQUESTS:
+                continue
+
+            elif kind == 'addChart' and not body.get('chart', {}).get('position', {}).get('newSheet'):
+                continue # a chart placed on a new sheet (position.newSheet) adds a sheet: invalidate
+
+            elif kind in ('addSheet', 'duplicateSheet') and kind in reply:
+                self._insert_sheet(reply[kind]['properties'])
+
+            elif kind == 'deleteSheet':
+                self._remove_sheet(body['sheetId'])
+
+            elif kind == 'updateSheetProperties' and body.get('fields', '*') != '*' and 'index' not in body['fields']:
+                properties = self._sheet_properties(body['properties']['sheetId'])
+                self._set_fields(properties, body['properties'], body['fields'])
+
+            elif kind == 'updateSpreadsheetProperties' and body.get('fields', '*') != '*':
+                self._set_fields(self._properties, body['properties'], body['fields'])
+
+            elif kind in ('insertDimension', 'deleteDimension'):
+                dimension = body['range']
+                count = dimension['endIndex'] - dimension['startIndex']
+                grid = self._sheet_properties(dimension['sheetId'])['gridProperties']
+                key = 'rowCount' if dimension['dimension'] == 'ROWS' else 'columnCount'
+                grid[key] += count if kind == 'insertDimension' else -count
+
+            elif kind == 'appendDimension':
+                grid = self._sheet_properties(body['sheetId'])['gridProperties']
+                key = 'rowCount' if body['dimension'] == 'ROWS' else 'columnCount'
+                grid[key] += body['length']
+
+            else:
+                self.invalidate_metadata()
+                return
+
+            # Sheets, titles or indices may have changed; rebuild the lookup maps when next needed
+            self._lookup = None
+
 
     def add_worksheet(self, title:str, index:int=None, worksheet_type:str=None, grid_properties:dict=None):
         """
@@ -1153,16 +2797,13 @@ class GoogleSheet:
         """
         Deletes the worksheet
         """
-        noSheet = True
-        for sheet in self._sheets:
-            if sheet['properties']['title'] == title:
-                self._delete_worksheet_by_id(worksheet_id=sheet['properties']['sheetId'])
-                noSheet = False
-                break
+        _, by_title, _ = self._sheet_lookup()
 
-        if noSheet:
+        if title not in by_title:
             raise WorksheetNotFound(f"No worksheet found with the title `{title}`.")
 
+        self._delete_worksheet_by_id(worksheet_id=by_title[title]['sheetId'])
+
 
     @classmethod
     def create_spreadsheet(cls, spreadsheet_title:str=None, **kwargs):
@@ -1177,7 +2818,7 @@ class GoogleSheet:
         client = GoogleSheetClient(**kwargs)
 
         if not spreadsheet_title:
-            gsheet = client.service.spreadsheets().create().execute()
+            gsheet = client.executor.execute(client.service.spreadsheets().create(), idempotent=False)
         
         else:
             spreadsheet_body = {
@@ -1195,11 +2836,11 @@ class GoogleSheet:
                 ]
             }
 
-            gsheet = client.service.spreadsheets().create(
+            gsheet = client.executor.execute(client.service.spreadsheets().create(
                 body=spreadsheet_body
-            ).execute()
+            ), idempotent=False)
         
-        return GoogleSheet(client=client, spreadsheet_id=gsheet['spreadsheetId'])
+        return GoogleSheet(client=client, spreadsheet_id=gsheet['spreadsheetId'], metadata=gsheet)
 
 
 class Worksheet:
@@ -1263,7 +2904,8 @@ class Worksheet:
             `coordinate`: `str` In A1 notation; e.g. 'A3', 'C5' etc
         """
         rng = self.title + "!" + coordinate
-        return self.get(range_=rng)[0][0]
+        values = self.get(range_=rng)
+        return values[0][0] if values and values[0] else '' # an empty cell has no value
 
     def update_cell(self, coordinate:str, value):
         """
@@ -1316,13 +2958,147 @@ class Worksheet:
             elif ":" in range_:
                 range_ = self.title + "!" + range_
 
-        response = self.spreadsheet.service.spreadsheets().values().get(
+        response = self.spreadsheet.executor.execute(self.spreadsheet.service.spreadsheets().values().get(
             spreadsheetId=self.spreadsheet.id,
             range=range_,
             majorDimension=majorDimension
-        ).execute()
+        ))
 
-        return response['values']
+        return response.get('values', []) # an empty range has no 'values'
+
+
+    def _get_row_block(self, first_row:int, last_row:int, in_worker:bool=False):
+        """
+        Values of the rows `first_row` to `last_row` (both inclusive).
+        In a worker thread the thread's own service object is used, as
+        the `httplib2` connection of the main service is not thread safe.
+        """
+        service = self.spreadsheet.service
+        if in_worker and getattr(self.client, 'credentials', None) is not None:
+            service = GoogleClientRegistry.get_service('sheet', self.client.credentials)
+
+        response = self.spreadsheet.executor.execute(service.spreadsheets().values().get(
+            spreadsheetId=self.spreadsheet.id,
+            range=f"{self.title}!{first_row}:{last_row}",
+            majorDimension='ROWS'
+        ))
+
+        return response.get('values', [])
+
+
+    def iter_rows(self, chunk_rows:int=1000, prefetch:bool=False, start_row:int=1):
+        """
+        Iterates over the rows of the worksheet, fetching `chunk_rows` rows
+        per request, so that only about one block (two with `prefetch`) is
+        held in memory at a time.
+
+        The iteration stops at the end of the grid (`row_count`) or at the
+        first block without any value in it. Empty rows between filled ones
+        are yielded as `[]`, so that the n-th row yielded is row
+        `start_row + n - 1` of the sheet.
+
+        Parameters:
+        -----------
+            `chunk_rows`: `int`; number of rows per request
+            `prefetch`: `bool`; if `True` the next block is fetched in a
+                        background thread while the current one is consumed
+            `start_row`: `int`; the (1-based) row to start from, e.g. to read
+                        only the rows appended since a previous run
+
+        Example:
+        --------
+            >>> for row in worksheet.iter_rows(chunk_rows=5000):
+            ...     process(row)
+        """
+        row_count = self.row_count
+        blocks = [
+            (first_row, min(first_row + chunk_rows - 1, row_count))
+            for first_row in range(start_row, row_count + 1, chunk_rows)
+        ]
+
+        pool = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            future = None
+            blank_rows = 0 # trailing empty rows of the previous block (trimmed by the API)
+
+            for i, (first_row, last_row) in enumerate(blocks):
+                if future is not None:
+                    values = future.result()
+                else:
+                    values = self._get_row_block(first_row, last_row)
+
+                if pool is not None and i + 1 < len(blocks):
+                    future = pool.submit(self._get_row_block, *blocks[i + 1], True)
+
+                if not values:
+                    return
+
+                for _ in range(blank_rows):
+                    yield []
+                yield from values
+
+                blank_rows = (last_row - first_row + 1) - len(values)
+                del values
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+
+    def buffered(self, max_cells:int=None, max_delay:float=None):
+        """
+        Returns a write-behind `BufferedWorksheet` over this worksheet; use it as a context manager
+
+        Example:
+        --------
+            >>> with worksheet.buffered() as wks:
+            ...     for i, name in enumerate(names, start=2):
+            ...         wks.update_cell(f'B{i}', name)
+            # all the writes are sent here, in one batchUpdate per `BATCH_UPDATE_MAX_BYTES`
+        """
+        return BufferedWorksheet(self, max_cells=max_cells, max_delay=max_delay)
+
+
+    def _absolute_range(self, range_:str):
+        """Prefixes `range_` with the worksheet title unless it already names a sheet"""
+        return range_ if '!' in range_ else self.title + '!' + range_
+
+
+    def batch_get(self, ranges:list, majorDimension:str='ROWS'):
+        """
+        Get values of many ranges of this worksheet in as few requests as possible
+        (see `GoogleSheet.batch_get()`)
+
+        Returns:
+        --------
+            `dict`: range (as given) -> `list[list[], ... , list[]]`
+
+        Example:
+        --------
+            >>> worksheet.batch_get(['A1:B1', 'D4'])
+                {'A1:B1': [['Timestamp', 'Price (INR)']], 'D4': [['42']]}
+        """
+        absolute = {range_: self._absolute_range(range_) for range_ in ranges}
+        values = self.spreadsheet.batch_get(list(absolute.values()), majorDimension=majorDimension)
+
+        return {range_: values[absolute_range] for range_, absolute_range in absolute.items()}
+
+
+    def batch_update(self, data:dict, value_input_option:str='USER_ENTERED'):
+        """
+        Updates many ranges of this worksheet in as few requests as possible
+        (see `GoogleSheet.batch_update()`)
+
+        Example:
+        --------
+            >>> worksheet.batch_update({'A1:B1': [[1, 3]], 'D4': [['done']]})
+        """
+        absolute = {range_: self._absolute_range(range_) for range_ in data}
+        results = self.spreadsheet.batch_update(
+            {absolute[range_]: values for range_, values in data.items()},
+            value_input_option=value_input_option
+        )
+
+        return {range_: results.get(absolute_range) for range_, absolute_range in absolute.items()}
 
 
     def update(self, range_, values:list):
@@ -1369,30 +3145,242 @@ class Worksheet:
             `dimension`:str; it could be 'ROWS' or 'COLUMNS'
         """
 
-        batch_update_spreadsheet_request_body = {
-            "requests": [
-                {
-                    'insertDimension': {
-                        "range": {
-                            "sheetId": self.id,
-                            "dimension": dimension,
-                            "startIndex": start_index,
-                            "endIndex": end_index
-                        }
-                    }
+        insert_dimension_request = {
+            'insertDimension': {
+                "range": {
+                    "sheetId": self.id,
+                    "dimension": dimension,
+                    "startIndex": start_index,
+                    "endIndex": end_index
                 }
-            ]
+            }
         }
     
-        # Inserting
-        response = self.spreadsheet.service.spreadsheets().batchUpdate(
-            spreadsheetId=self.spreadsheet.id,
-            body=batch_update_spreadsheet_request_body
-        ).execute()
+        # Inserting; this also updates the cached `row_count` / `col_count`
+        self.spreadsheet.batch_requests_update(list_of_requests=[insert_dimension_request])
 
-        pprint(response)
 
 
+class BufferedWorksheet:
+    """
+    A write-behind buffer over a `Worksheet`.
+
+    Writes made through `update_cell()` and `update()` are kept in memory and
+    sent together by `flush()`: adjacent cells are merged into rectangular ranges
+    and all of them go out through `GoogleSheet.batch_update()`, i.e. a single
+    `values().batchUpdate` unless the values exceed `BATCH_UPDATE_MAX_BYTES`. The buffer is
+    flushed when the `with` block exits, when `max_cells` cells are pending, or
+    on the first write or read once the oldest pending write is `max_delay`
+    seconds old. Reads through `get_cell()` and `get()` see the pending values.
+
+    N.B: There is no background timer; `max_delay` is only checked when the
+    buffer is used, so an idle buffer keeps its writes until the next call,
+    `flush()` or the end of the `with` block.
+
+    Author: Indrajit Ghosh
+    Date: Oct 17, 2026
+
+    Parameters:
+    -----------
+        `worksheet`: `Worksheet`
+        `max_cells`: `int`; number of pending cells that triggers a flush
+        `max_delay`: optional; `float` seconds a write may stay pending
+    """
+
+    MAX_CELLS = 10000
+
+    def __init__(self, worksheet:Worksheet, max_cells:int=None, max_delay:float=None):
+
+        self.worksheet = worksheet
+        self.max_cells = self.MAX_CELLS if max_cells is None else max_cells
+        self.max_delay = max_delay
+
+        self._pending = {} # (row, col) -> value
+        self._pending_since = None
+
+
+    def __repr__(self):
+        return "<{} {} pending:{}>".format(
+            self.__class__.__name__,
+            repr(self.worksheet.title),
+            len(self._pending),
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+
+    @property
+    def pending(self):
+        """Number of cells waiting to be written"""
+        return len(self._pending)
+
+
+    def _record(self, row:int, col:int, value):
+        if not self._pending:
+            self._pending_since = time.monotonic()
+        self._pending[(row, col)] = value
+
+    def _maybe_flush(self):
+        if len(self._pending) >= self.max_cells or (
+            self.max_delay is not None
+            and self._pending
+            and time.monotonic() - self._pending_since >= self.max_delay
+        ):
+            self.flush()
+
+
+    def update_cell(self, coordinate:str, value):
+        """
+        Buffers a write of a single cell
+
+        Parameters:
+        -----------
+            `coordinate`: `str` In A1 notation; e.g. 'A3', 'C5' etc
+            `value`: `Any`
+        """
+        row, col = a1_to_rowcol(coordinate)
+        self._record(row, col, value)
+        self._maybe_flush()
+
+
+    def update(self, range_:str, values:list):
+        """
+        Buffers a write of `values` starting at the top left cell of `range_`
+
+        Parameters:
+        ----------
+            `range_`: str in A1 notation of this worksheet, e.g. 'A1:B1' or 'A1'
+            `values`: list[list[], ... ,list[]]
+        """
+        start_row, start_col = a1_to_rowcol(range_.split(':')[0])
+
+        for i, row_values in enumerate(values):
+            for j, value in enumerate(row_values):
+                self._record(start_row + i, start_col + j, value)
+
+        self._maybe_flush()
+
+
+    def get_cell(self, coordinate:str):
+        """Gets the cell value, a pending one if there is"""
+        self._maybe_flush()
+        row, col = a1_to_rowcol(coordinate)
+
+        if (row, col) in self._pending:
+            return self._pending[(row, col)]
+
+        return self.worksheet.get_cell(coordinate)
+
+
+    def get(self, range_:str=None):
+        """
+        Gets the values of `range_` (see `Worksheet.get()`) with the pending
+        writes inside that range applied on top. Any A1 range works, e.g.
+        'A1:C3', 'B2', 'A:B', 'A2:C', '2:5' or 'Sheet1!A1:B2'.
+        """
+        self._maybe_flush()
+
+        if range_ is None:
+            values = self.worksheet.get()
+            sheet, a1 = '', ''
+        else:
+            range_ = self.worksheet._absolute_range(range_)
+            values = self.worksheet.get(range_=range_)
+            sheet, a1 = split_sheet_range(range_)
+
+        values = [list(row) for row in values]
+
+        # The pending writes belong to this worksheet only
+        if sheet and sheet[:-1].strip("'").replace("''", "'") != self.worksheet.title:
+            return values
+
+        top, left, bottom, right = a1_range_bounds(a1)
+
+        for (row, col), value in self._pending.items():
+            if (
+                row < top or col < left
+                or (bottom is not None and row > bottom)
+                or (right is not None and col > right)
+            ):
+                continue
+
+            i, j = row - top, col - left
+            values.extend([] for _ in range(i + 1 - len(values)))
+            values[i].extend('' for _ in range(j + 1 - len(values[i])))
+            values[i][j] = value
+
+        return values
+
+
+    @staticmethod
+    def merge_cells(cells:dict):
+        """
+        Merges single cells into rectangular ranges: first into horizontal runs
+        of adjacent columns, then runs spanning the same columns on consecutive
+        rows are stacked.
+
+        Parameters:
+        -----------
+            `cells`: `dict` (row, col) -> value
+
+        Returns:
+        --------
+            `dict`: range in A1 notation (e.g. 'B2:D5') -> list[list[], ... ,list[]]
+        """
+        # Horizontal runs: (row, first col, last col, values)
+        runs = []
+        for row, col in sorted(cells):
+            if runs and runs[-1][0] == row and runs[-1][2] == col - 1:
+                run = runs[-1]
+                runs[-1] = (row, run[1], col, run[3] + [cells[(row, col)]])
+            else:
+                runs.append((row, col, col, [cells[(row, col)]]))
+
+        # Stack runs with the same columns: (first col, last col) -> [first row, last row, values]
+        open_rectangles = {}
+        rectangles = []
+        for row, first_col, last_col, values in runs:
+            rectangle = open_rectangles.get((first_col, last_col))
+            if rectangle is not None and rectangle[1] == row - 1:
+                rectangle[1] = row
+                rectangle[2].append(values)
+            else:
+                rectangle = [row, row, [values]]
+                open_rectangles[(first_col, last_col)] = rectangle
+                rectangles.append((first_col, last_col, rectangle))
+
+        merged = {}
+        for first_col, last_col, (first_row, last_row, values) in rectangles:
+            start, end = rowcol_to_a1(first_row, first_col), rowcol_to_a1(last_row, last_col)
+            merged[start if start == end else f"{start}:{end}"] = values
+
+        return merged
+
+
+    def flush(self):
+        """
+        Writes all the pending cells with `GoogleSheet.batch_update()`, in a single
+        batchUpdate unless the values exceed `GoogleSheet.BATCH_UPDATE_MAX_BYTES`
+
+        Returns:
+        --------
+            `dict`: range -> `UpdateValuesResponse` (see `Worksheet.batch_update()`)
+        """
+        if not self._pending:
+            return {}
+
+        data = self.merge_cells(self._pending)
+        response = self.worksheet.batch_update(data)
+
+        self._pending = {}
+        self._pending_since = None
+
+        return response
+
 
 def main():
     print('Classes required for Google APIs')
@@ -0,0 +1,245 @@
+# Local read-through cache of Google Sheets values
+#
+# Author: Indrajit Ghosh
+#
+# Date: Oct 17, 2026
+#
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from .exceptions import CacheMiss, WorksheetNotFound
+
+__all__ = ['SheetCache']
+
+
+class SheetCache:
+    """
+    An on-disk cache of worksheet values.
+
+    Every cached range is stored together with the spreadsheet's Drive revision
+    ('modifiedTime' and 'version'). Within `ttl` seconds of the last check a
+    cached range is served without any network call; afterwards one cheap Drive
+    `files().get` decides whether the local copy is still current, and only a
+    changed spreadsheet is read again from the Sheets API.
+
+    The spreadsheet metadata is snapshotted next to the values, so that in
+    `offline` mode the last snapshot can be served without any credentials.
+
+    Parameters:
+    -----------
+        `client`: optional; a `GoogleSheetClient`, created on first use
+        `drive`: optional; a `GoogleDrive` used for the revision check, created on first use
+        `path`: optional; the cache directory
+        `ttl`: `float` seconds during which a cached range is trusted without
+                asking Drive; 0 checks the revision on every call
+        `offline`: `bool`; serve the last snapshot only, never touching the network
+
+    Example:
+    --------
+        >>> cache = SheetCache(ttl=300)
+        >>> data = cache.get(SYMPOSIUM_SHEET_ID)           # first worksheet, all values
+        >>> data = cache.get(SYMPOSIUM_SHEET_ID, bypass=True)   # force a fresh read
+        >>> data = SheetCache(offline=True).get(SYMPOSIUM_SHEET_ID)
+    """
+
+    DEFAULT_PATH = Path(__file__).resolve().parent / '.cache' / 'sheets'
+    REVISION_FIELDS = "modifiedTime, version"
+    DEFAULT_TTL = 60
+
+    def __init__(self, client=None, drive=None, path=DEFAULT_PATH, ttl:float=DEFAULT_TTL, offline:bool=False):
+
+        self._client = client
+        self._drive = drive
+        self.path = Path(path)
+        self.ttl = ttl
+        self.offline = offline
+
+
+    def __repr__(self):
+        return "<{} {}{}>".format(
+            self.__class__.__name__,
+            repr(str(self.path)),
+            " offline" if self.offline else "",
+        )
+
+
+    @property
+    def client(self):
+        if self._client is None:
+            from .model import GoogleSheetClient
+            self._client = GoogleSheetClient()
+        return self._client
+
+    @property
+    def drive(self):
+        if self._drive is None:
+            from .model import GoogleDrive
+            self._drive = GoogleDrive()
+        return self._drive
+
+
+    def _metadata_file(self, spreadsheet_id:str):
+        return self.path / spreadsheet_id / 'metadata.json'
+
+    def _values_file(self, spreadsheet_id:str, sheet_id:int, range_:str, majorDimension:str):
+        key = json.dumps([sheet_id, range_, majorDimension])
+        return self.path / spreadsheet_id / (hashlib.sha1(key.encode()).hexdigest() + '.json')
+
+
+    @staticmethod
+    def _read(path:Path):
+        """Returns the JSON content of `path`, or `None` if it is missing or unreadable"""
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write(path:Path, data:dict):
+        """Writes `data` to `path` atomically, so that a crash never leaves a truncated file"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.part', dir=path.parent)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+
+    def revision(self, spreadsheet_id:str):
+        """
+        Returns:
+        --------
+            `dict` with the keys 'modifiedTime' and 'version' of the spreadsheet's Drive file
+        """
+        return self.drive.get_metadata(spreadsheet_id, fields=self.REVISION_FIELDS)
+
+
+    @staticmethod
+    def _sheet_properties(metadata:dict, sheet):
+        """The properties of the worksheet `sheet` (an index or a title) in `metadata`"""
+        for s in metadata['sheets']:
+            properties = s['properties']
+            if (isinstance(sheet, int) and properties['index'] == sheet) or properties['title'] == sheet:
+                return properties
+
+        raise WorksheetNotFound(sheet)
+
+
+    def metadata(self, spreadsheet_id:str):
+        """
+        Returns the last metadata snapshot of the spreadsheet (see `GoogleSheet.spreadsheet`)
+        or `None` if there is none
+        """
+        snapshot = self._read(self._metadata_file(spreadsheet_id))
+        return None if snapshot is None else snapshot['metadata']
+
+
+    def get(self, spreadsheet_id:str, sheet=0, range_:str=None, majorDimension:str='ROWS', bypass:bool=False):
+        """
+        Values of a worksheet range (see `Worksheet.get()`), served from the
+        cache whenever the spreadsheet has not changed.
+
+        Parameters:
+        -----------
+            `spreadsheet_id`: `str`
+            `sheet`: `int` index or `str` title of the worksheet; defaults to the first one
+            `range_`: optional; range in A1 notation, the whole worksheet if `None`
+            `majorDimension`: 'ROWS' or 'COLUMNS'
+            `bypass`: `bool`; skip the cache and read the range again (the fresh
+                    values are still stored)
+
+        Returns:
+        --------
+            `list[list[], ... , list[]]`
+
+        Raises:
+        -------
+            `CacheMiss` in `offline` mode if the range was never cached
+        """
+        snapshot = self._read(self._metadata_file(spreadsheet_id))
+        entry_file = entry = None
+
+        if snapshot is not None:
+            try:
+                properties = self._sheet_properties(snapshot['metadata'], sheet)
+            except WorksheetNotFound:
+                if self.offline:
+                    raise
+            else:
+                entry_file = self._values_file(spreadsheet_id, properties['sheetId'], range_, majorDimension)
+                entry = self._read(entry_file)
+
+        if self.offline:
+            if entry is None:
+                raise CacheMiss(f"No cached values of {range_ or 'the worksheet'!r} (sheet {sheet!r}) of {spreadsheet_id!r}.")
+            return entry['values']
+
+        if not bypass and entry is not None and time.time() - entry['checked_at'] < self.ttl:
+            return entry['values']
+
+        revision = self.revision(spreadsheet_id)
+
+        if not bypass and entry is not None and entry['revision'] == revision:
+            entry['checked_at'] = time.time()
+            self._write(entry_file, entry)
+            return entry['values']
+
+        return self._fetch(spreadsheet_id, sheet, range_, majorDimension, revision, snapshot)
+
+
+    def _fetch(self, spreadsheet_id:str, sheet, range_:str, majorDimension:str, revision:dict, snapshot:dict):
+        """Reads the range from the Sheets API and stores it (and the metadata snapshot)"""
+        from .model import GoogleSheet
+
+        if snapshot is not None and snapshot['revision'] == revision:
+            spreadsheet = GoogleSheet(client=self.client, spreadsheet_id=spreadsheet_id, metadata=snapshot['metadata'])
+        else:
+            spreadsheet = GoogleSheet(client=self.client, spreadsheet_id=spreadsheet_id)
+            self._write(
+                self._metadata_file(spreadsheet_id),
+                {'revision': revision, 'metadata': spreadsheet.spreadsheet}
+            )
+
+        if isinstance(sheet, int):
+            worksheet = spreadsheet.get_worksheet(sheet)
+        else:
+            worksheet = spreadsheet.get_worksheet_by_title(sheet)
+
+        values = worksheet.get(range_=range_, majorDimension=majorDimension)
+
+        self._write(
+            self._values_file(spreadsheet_id, worksheet.id, range_, majorDimension),
+            {
+                'range': range_,
+                'majorDimension': majorDimension,
+                'revision': revision,
+                'checked_at': time.time(),
+                'values': values,
+            }
+        )
+
+        return values
+
+
+    def invalidate(self, spreadsheet_id:str=None):
+        """Removes the cached values of `spreadsheet_id`, or of every spreadsheet if `None`"""
+        target = self.path if spreadsheet_id is None else self.path / spreadsheet_id
+        shutil.rmtree(target, ignore_errors=True)
+
+
+def main():
+    print('Local read-through cache of Google Sheets values')
+
+
+if __name__ == '__main__':
+    main()
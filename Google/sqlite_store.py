@@ -0,0 +1,89 @@
+# SQLite scaffolding shared by the local stores of API data
+#
+# Author: Indrajit Ghosh
+#
+# Date: Oct 17, 2026
+#
+
+import sqlite3
+from pathlib import Path
+
+__all__ = ['SQLiteStore']
+
+
+class SQLiteStore:
+    """
+    Base of the on-disk (SQLite) stores kept current through an API
+    (`DriveIndex`, `GmailStore`).
+
+    It opens the database, creates the tables of `SCHEMA` and a `state`
+    key -> value table holding the sync position (a Changes API token, a
+    `historyId`, ...). A subclass sets `SCHEMA`, `TABLE` (the table counted by
+    `len()`) and implements `get()`.
+
+    Parameters:
+    -----------
+        `path`: location of the SQLite database file. Use ':memory:' for a throw away store.
+    """
+
+    SCHEMA = ""
+    TABLE = None
+
+    STATE_SCHEMA = """
+        CREATE TABLE IF NOT EXISTS state (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    def __init__(self, path):
+
+        self.path = path
+
+        if path != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.connection = sqlite3.connect(str(path))
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(self.SCHEMA + self.STATE_SCHEMA)
+
+
+    def __repr__(self):
+        return "<{} {} {}:{}>".format(
+            self.__class__.__name__,
+            repr(str(self.path)),
+            self.TABLE,
+            len(self),
+        )
+
+    def __len__(self):
+        return self.connection.execute(f"SELECT COUNT(*) FROM {self.TABLE}").fetchone()[0]
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def close(self):
+        self.connection.close()
+
+
+    def get(self, key:str):
+        raise NotImplementedError
+
+
+    def _get_state(self, key:str):
+        """The stored value of `key` in the `state` table, or `None`"""
+        row = self.connection.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        return None if row is None else row['value']
+
+    def _set_state(self, key:str, value):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", (key, str(value))
+        )
+
+
+def main():
+    print('SQLite scaffolding shared by the local stores of API data')
+
+
+if __name__ == '__main__':
+    main()
@@ -5,11 +5,177 @@
 # Date: Aug 28, 2022
 #
 
+import base64
 from pathlib import Path
-from model import *
+
+from .model import *
+from .drive_index import DriveIndex
+from .gmail_store import GmailStore
+
+
+class _FakeRequest:
+    """Stands for a `googleapiclient` request: `execute()` returns `response()`"""
+    def __init__(self, response):
+        self.response = response
+
+    def execute(self, **kwargs):
+        return self.response()
+
+
+class _FakeBatch:
+    """Stands for `new_batch_http_request()`: runs the added requests one by one"""
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self, **kwargs):
+        for request_id, request in self.requests:
+            self.callback(request_id, request.execute(), None)
+
+
+class FakeDriveService:
+    """
+    The part of the Drive API used by `DriveIndex`: `changes().getStartPageToken`
+    and `changes().list`. `changes` is the list of changes since token '1'.
+    """
+    def __init__(self):
+        self.changes_since_start = []
+
+    def changes(self):
+        return self
+
+    def getStartPageToken(self):
+        return _FakeRequest(lambda: {'startPageToken': '1'})
+
+    def list(self, pageToken, **kwargs):
+        return _FakeRequest(lambda: {'changes': self.changes_since_start, 'newStartPageToken': '2'})
+
+
+class FakeDrive:
+    """A `GoogleDrive` stand-in over `FakeDriveService`, listing `files`"""
+    def __init__(self, files):
+        self.files = files
+        self.service = FakeDriveService()
+        self.executor = RequestExecutor(retries=0)
+
+    def iter_files(self, query=None, fields=None):
+        return iter(self.files)
+
+
+class FakeGmailService:
+    """
+    The part of the Gmail API used by `GmailStore`: `users().getProfile`,
+    `messages().list` / `get` (also batched) and `history().list`.
+    `messages` maps a message id to its resource; `history` holds the records
+    returned after the profile's `history_id`.
+    """
+    def __init__(self, messages):
+        self.messages_by_id = messages
+        self.history_records = []
+        self.history_id = '100'
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+    def history(self):
+        return _FakeHistory(self)
+
+    def getProfile(self, userId):
+        return _FakeRequest(lambda: {'historyId': self.history_id})
+
+    def list(self, userId, labelIds=None, **kwargs):
+        return _FakeRequest(lambda: {'messages': [
+            {'id': m['id'], 'threadId': m['threadId']}
+            for m in self.messages_by_id.values()
+            if labelIds is None or set(labelIds) <= set(m['labelIds'])
+        ]})
+
+    def get(self, userId, id, **kwargs):
+        return _FakeRequest(lambda: self.messages_by_id[id])
+
+    def new_batch_http_request(self, callback):
+        return _FakeBatch(callback)
+
+
+class _FakeHistory:
+    def __init__(self, service):
+        self.service = service
+
+    def list(self, userId, startHistoryId, **kwargs):
+        return _FakeRequest(lambda: {'history': self.service.history_records, 'historyId': self.service.history_id})
+
+
+def fake_message(message_id:str, subject:str, label_ids=('INBOX',)):
+    """A `messages().get` resource with a plain text body"""
+    return {
+        'id': message_id,
+        'threadId': message_id,
+        'labelIds': list(label_ids),
+        'internalDate': '0',
+        'payload': {
+            'mimeType': 'text/plain',
+            'headers': [{'name': 'Subject', 'value': subject}, {'name': 'From', 'value': 'bot@example.com'}],
+            'body': {'data': base64.urlsafe_b64encode(subject.encode()).decode()},
+        },
+    }
+
+
+def check_drive_index():
+    """Crawls and syncs a `DriveIndex` over a fake Drive service"""
+    drive = FakeDrive(files=[
+        {'id': 'f1', 'name': 'abstract.tex', 'mimeType': 'text/x-tex', 'parents': ['d1']},
+        {'id': 'd1', 'name': 'abstracts', 'mimeType': DriveIndex.FOLDER_MIMETYPE, 'parents': []},
+    ])
+    index = DriveIndex(drive=drive, path=':memory:')
+
+    assert index.sync() == 2 and index.page_token == '1'
+    assert index.get_file_id('abstract.tex', parent_cloud_dir_id='d1') == 'f1'
+
+    drive.service.changes_since_start = [
+        {'fileId': 'f2', 'file': {'id': 'f2', 'name': 'schedule.tex', 'parents': ['d1']}},
+        {'fileId': 'f1', 'removed': True},
+    ]
+    assert index.sync() == 2 and index.page_token == '2'
+    assert 'f1' not in index and index.get_file_id('schedule.tex') == 'f2'
+
+    print(f"{index}: ok")
+
+
+def check_gmail_store():
+    """Crawls and syncs a `GmailStore` over a fake Gmail service"""
+    service = FakeGmailService(messages={
+        'm1': fake_message('m1', 'Registration'),
+        'm2': fake_message('m2', 'Schedule'),
+        'm3': fake_message('m3', 'Spam', label_ids=['SPAM']),
+    })
+    store = GmailStore(gmail=Gmail(service=service, executor=RequestExecutor(retries=0)), path=':memory:')
+
+    assert store.sync() == {'full': True, 'added': 2, 'deleted': 0}
+    assert store.get('m2')['body'] == 'Schedule' and 'm3' not in store
+
+    service.messages_by_id['m4'] = fake_message('m4', 'Abstract')
+    service.history_records = [
+        {'messagesAdded': [{'message': {'id': 'm4'}}]},
+        {'labelsRemoved': [{'message': {'id': 'm1'}, 'labelIds': ['INBOX']}]},
+    ]
+    service.history_id = '101'
+    assert store.sync() == {'full': False, 'added': 1, 'deleted': 1}
+    assert sorted(m['id'] for m in store.messages()) == ['m2', 'm4']
+
+    print(f"{store}: ok")
 
 
 def main():
+    # Checks on fake services, needing neither network nor credentials
+    check_drive_index()
+    check_gmail_store()
+
     # email = GmailMessage(
     #     sender_email_id='ma19d002@smail.iitm.ac.in',
     #     to=['indrajitghosh912@gmail.com', 'rs_math1902@isibang.ac.in'],
@@ -0,0 +1,119 @@
+# mail_merge.py
+# Author: Indrajit Ghosh
+# Created On: Oct 17, 2026
+#
+# Sends the per-speaker schedule confirmations of the Symposium
+#
+import argparse
+
+from tabulate import tabulate
+
+from Google import Gmail, GmailMessage
+from main import fetch_sheet_data, get_participants_and_speakers, SYMPOSIUM_SHEET_ID
+from registration import parse_registrations
+from schedule import create_schedule
+
+SENDER_EMAIL = "indrajitsbot@gmail.com"
+
+SUBJECT_TEMPLATE = "ISI Symposium 2025: your talk is scheduled on Day {day}"
+
+BODY_TEMPLATE = """Dear {name},
+
+Thank you for registering to give a talk at the ISI Symposium 2025.
+Your talk is scheduled on Day {day} (talk {slot} of the day).
+
+Please reply to this email if you cannot make it on that day.
+
+Best regards,
+Indrajit Ghosh
+"""
+
+
+def render_messages(recipients, subject_template, body_template, sender_email=SENDER_EMAIL, context=None):
+    """
+    Renders one `GmailMessage` per recipient from the templates.
+
+    The templates are `str.format` strings; they can use every `Registration` field
+    (e.g. `{name}`, `{affiliation}`) and the recipient's entries of `context`.
+
+    :param recipients: List of `Registration` records.
+    :param subject_template: Template of the subject.
+    :param body_template: Template of the plain text body.
+    :param sender_email: The sender of the messages.
+    :param context: Optional dict of email -> dict of extra template fields.
+    :return: Dict of recipient email -> `GmailMessage`.
+    """
+    context = {} if context is None else context
+    messages = {}
+
+    for r in recipients:
+        fields = {**r.to_dict(), **context.get(r.email, {})}
+        messages[r.email] = GmailMessage(
+            sender_email_id=sender_email,
+            to=r.email,
+            subject=subject_template.format_map(fields),
+            email_plain_text=body_template.format_map(fields),
+        )
+
+    return messages
+
+
+def schedule_context(schedule):
+    """
+    :param schedule: The schedule from `create_schedule`.
+    :return: Dict of speaker email -> {'day': day number, 'slot': position on that day}.
+    """
+    return {
+        talk.email: {'day': day, 'slot': slot}
+        for day, talks in enumerate(schedule, start=1)
+        for slot, talk in enumerate(talks, start=1)
+    }
+
+
+def main():
+    """
+    Renders the schedule confirmation of every speaker and, with `--send`, sends them
+    through one Gmail account (a bounded pool of workers within the send quota).
+    Without `--send` the messages are only printed.
+    """
+    parser = argparse.ArgumentParser(description="Send the schedule confirmations to the speakers")
+    parser.add_argument("--send", action="store_true", help="send the messages (default: only print them)")
+    parser.add_argument("--workers", type=int, default=4, help="number of messages sent concurrently")
+    parser.add_argument("--refresh", action="store_true", help="ignore the local cache and fetch the sheet again")
+    parser.add_argument("--offline", action="store_true", help="use the last cached copy of the sheet")
+    args = parser.parse_args()
+
+    data = fetch_sheet_data(SYMPOSIUM_SHEET_ID, refresh=args.refresh, offline=args.offline)
+    if data is None:
+        return
+
+    if not data or len(data) < 2:
+        print("No data available in the sheet.")
+        return
+
+    _, speakers = get_participants_and_speakers(parse_registrations(data))
+    schedule = create_schedule(speakers, total_days=3, max_talks_per_day=5, randomize=False)
+    context = schedule_context(schedule)
+
+    # Only the scheduled speakers get a confirmation
+    scheduled = [s for s in speakers if s.email in context]
+    messages = render_messages(scheduled, SUBJECT_TEMPLATE, BODY_TEMPLATE, context=context)
+
+    if not args.send:
+        for email, msg in messages.items():
+            print(f"To: {email}\nSubject: {msg.subject}\n\n{msg.plain_msg}")
+            print('-' * 60)
+        print(f"{len(messages)} messages rendered; run with --send to send them.")
+        return
+
+    report = Gmail().send_many(messages, max_workers=args.workers)
+
+    print(tabulate(
+        [[email, r['status'], r['attempts'], r['id'] or r['error']] for email, r in report.items()],
+        headers=["Recipient", "Status", "Attempts", "Message Id / Error"],
+        tablefmt="grid"
+    ))
+
+
+if __name__ == '__main__':
+    main()
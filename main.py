@@ -5,13 +5,38 @@
 # This script can be used to generate all necessary 
 # documents for the Symposium
 #
-from Google import *
+import argparse
+
+from Google import GoogleSheetClient, GoogleSheet, SheetCache, CacheMiss
+from registration import parse_registrations, RegistrationState, ResponseStats
 from tabulate import tabulate
 
 SYMPOSIUM_SHEET_ID = "1oWc3pIBOhDinA3qak3Hqt8YxkubCc17sIIsZuqeUEPM"
 SPEAKER_INFO_SHEET_ID = "1Nh6gFkamgS06SFGWfhMWhUmc1CgPZLVFYKbtPBSsrck"
 
 
+def fetch_sheet_data(spreadsheet_id, refresh=False, offline=False):
+    """
+    Fetches all values of the first worksheet of a Google Sheet through the local cache.
+
+    The cached copy is reused as long as the sheet is unchanged on Google Drive.
+
+    :param spreadsheet_id: ID of the Google Sheet.
+    :param refresh: If True, the cache is bypassed and the sheet is read again.
+    :param offline: If True, the last cached snapshot is used without any network access.
+    :return: List of lists representing the rows of the sheet (including headers),
+             or None (after printing why) if offline and the sheet was never cached.
+    """
+    try:
+        return SheetCache(offline=offline).get(spreadsheet_id, sheet=0, bypass=refresh)
+    except CacheMiss:
+        print(
+            f"There is no cached copy of the sheet {spreadsheet_id} to use offline.\n"
+            "Run once without --offline (or with --refresh) to fetch and cache it."
+        )
+        return None
+
+
 def print_sheet_data(sheet_data, headers=None):
     """
     Prints Google Sheet data in a tabular format.
@@ -25,109 +50,130 @@ def print_sheet_data(sheet_data, headers=None):
         print(tabulate(sheet_data, tablefmt="grid"))
 
 
-def print_responses_for_talk(data):
+def print_responses_for_talk(registrations):
     """
     Prints responses for the talk in a tabular format.
 
-    :param data: List of lists representing the rows of the sheet.
+    :param registrations: List of `Registration` records.
     """
     headers = ['Timestamp', 'Name', 'Email', 'Affiliation', 'Wanna talk?', 'Wanna attend?']
-    print_sheet_data(sheet_data=data, headers=headers)
+    print_sheet_data(sheet_data=[r.as_response_row() for r in registrations], headers=headers)
 
 
-def get_participants_and_speakers(data):
+def get_participants_and_speakers(registrations):
     """
-    Extracts participants and speakers from the Google Sheet data.
+    Extracts participants and speakers from the registration records.
 
-    :param data: List of lists representing the rows of the sheet (excluding headers).
+    :param registrations: List of `Registration` records (see `registration.parse_registrations`).
     :return: Tuple containing two lists:
-             - participants: List of [timestamp, name, email, affiliation] for attendees.
-             - speakers: List of [timestamp, name, email, affiliation] for those who want to give a talk.
+             - participants: List of `Registration` records of the attendees.
+             - speakers: List of `Registration` records of those who want to give a talk.
     """
-    participants = []
-    speakers = []
-
-    for row in data:
-        timestamp = row[0].strip()
-        name = row[1].strip()
-        email = row[2].strip()
-        affiliation = row[3].strip()
-        wanna_talk = row[4].strip().lower() == "yes"
-        wanna_attend = row[5].strip().lower() == "yes"
-
-        if wanna_attend:
-            participants.append([timestamp, name, email, affiliation])
-        if wanna_talk:
-            speakers.append([timestamp, name, email, affiliation])
+    participants = [r for r in registrations if r.wants_to_attend]
+    speakers = [r for r in registrations if r.wants_to_talk]
 
     return participants, speakers
 
 
-def summarize_responses(data):
+def summarize_responses(stats):
     """
-    Summarizes the total responses and the "Wanna Talk" preferences by category (PhD, PostDoc).
+    Summarizes the total responses and the "Wanna Talk" preferences by category (PhD, PostDoc, ...)
+    and the number of registrations per day.
 
-    :param data: List of lists representing the rows of the sheet (excluding headers).
+    :param stats: `ResponseStats` of the registrations (grouped by 'category' and 'day').
     """
-    total_phd = 0
-    total_postdoc = 0
-    talk_phd = 0
-    talk_postdoc = 0
-
-    for row in data:
-        affiliation = row[3].strip().lower()
-        wanna_talk = row[4].strip().lower() == "yes"
+    categories = stats.groups['category'].values()
+    total_speakers = sum(c['speakers'] for c in categories)
 
-        if affiliation == "phd":
-            total_phd += 1
-            if wanna_talk:
-                talk_phd += 1
-        elif affiliation == "post doc":
-            total_postdoc += 1
-            if wanna_talk:
-                talk_postdoc += 1
+    by_category = ", ".join(f"{c['responses']} {c['label']}" for c in categories)
+    talks_by_category = ", ".join(f"{c['speakers']} {c['label']}" for c in categories)
 
-    total_responses = total_phd + total_postdoc
-    total_speakers = talk_phd + talk_postdoc
+    print(f"Total responses: ({by_category}) = {stats.responses}")
+    print(f"Wanna Talk: ({talks_by_category}) = {total_speakers}")
 
-    print(f"Total responses: ({total_phd} PhD, {total_postdoc} PostDoc) = {total_responses}")
-    print(f"Wanna Talk: ({talk_phd} PhD, {talk_postdoc} PostDoc) = {total_speakers}")
+    print("\nRegistrations per day:")
+    print_sheet_data(
+        sheet_data=[[day, c['responses'], c['speakers']] for day, c in stats.groups['day'].items()],
+        headers=["Day", "Responses", "Wanna talk"]
+    )
 
 
-def all_data():
-    # Fetching data from Google Sheets
-    client = GoogleSheetClient()
-    spreadsheet = GoogleSheet(client=client, spreadsheet_id=SYMPOSIUM_SHEET_ID)
-    ws = spreadsheet.get_worksheet(0)
-    data = ws.get()
+def all_data(refresh=False, offline=False):
+    # Fetching data from Google Sheets (or the local cache)
+    data = fetch_sheet_data(SYMPOSIUM_SHEET_ID, refresh=refresh, offline=offline)
+    if data is None:
+        return
 
     if not data or len(data) < 2:
         print("No data available in the sheet.")
         return
 
+    # Parse the rows once and compute every count in a single pass
+    registrations = parse_registrations(data)
+    stats = ResponseStats.from_registrations(registrations)
+
     # Summarize responses
-    summarize_responses(data=data[1:])
+    summarize_responses(stats)
 
     # Print responses for the talk
-    print_responses_for_talk(data=data[1:])
+    print_responses_for_talk(registrations)
 
     # Get participants and speakers
-    participants, speakers = get_participants_and_speakers(data=data[1:])
+    participants, speakers = stats.participants, stats.speakers
     print(f"\nParticipants: {len(participants)}")
-    print_sheet_data(sheet_data=participants, headers=["Timestamp", "Name", "Email", "Affiliation"])
+    print_sheet_data(sheet_data=[r.as_row() for r in participants], headers=["Timestamp", "Name", "Email", "Affiliation"])
     print(f"\nSpeakers: {len(speakers)}")
-    print_sheet_data(sheet_data=speakers, headers=["Timestamp", "Name", "Email", "Affiliation"])
+    print_sheet_data(sheet_data=[r.as_row() for r in speakers], headers=["Timestamp", "Name", "Email", "Affiliation"])
+
 
+def new_registrations(refresh=False, offline=False):
+    """
+    Processes only the form responses received since the previous run.
+
+    The last processed row and the statistics so far are kept in a local state file,
+    so only the rows after it are fetched (in bounded row blocks) and counted.
+    Fetching new responses needs the network; offline only the saved statistics are shown.
+
+    :param refresh: If True, the saved state is discarded and every response is processed again.
+    :param offline: If True, nothing is fetched and the statistics of the saved state are printed.
+    """
+    if offline:
+        if refresh:
+            print("--refresh and --offline cannot be combined: reprocessing every response needs the network.")
+            return
+
+        state = RegistrationState.load(SYMPOSIUM_SHEET_ID)
+        if state.header is None:
+            print("No responses were processed yet; run option 3 once without --offline.")
+            return
+
+        print(f"\nOffline: new responses are not fetched; statistics up to sheet row {state.last_row}.")
+    else:
+        state = RegistrationState(SYMPOSIUM_SHEET_ID) if refresh else RegistrationState.load(SYMPOSIUM_SHEET_ID)
 
-def speaker_info():
+        client = GoogleSheetClient()
+        spreadsheet = GoogleSheet(client=client, spreadsheet_id=SYMPOSIUM_SHEET_ID)
+        ws = spreadsheet.get_worksheet(0)
+
+        registrations = state.update(ws.iter_rows(chunk_rows=500, start_row=state.next_row))
+        state.save()
+
+        print(f"\nNew responses: {len(registrations)}")
+        if registrations:
+            print_responses_for_talk(registrations)
+
+    summarize_responses(state.stats)
+    print(f"\nParticipants: {len(state.stats.participants)}")
+    print(f"Speakers: {len(state.stats.speakers)}")
+
+
+def speaker_info(refresh=False, offline=False):
     """
     Fetches and prints the speaker information from the Google Sheet in a two-column format using tabulate.
     """
-    # Initialize Google Sheet Client
-    speaker_client = GoogleSheetClient()
-    sh = GoogleSheet(client=speaker_client, spreadsheet_id=SPEAKER_INFO_SHEET_ID)
-    worksheet = sh.get_worksheet(0)
-    speaker_data = worksheet.get()
+    speaker_data = fetch_sheet_data(SPEAKER_INFO_SHEET_ID, refresh=refresh, offline=offline)
+    if speaker_data is None:
+        return
 
     if not speaker_data or len(speaker_data) < 2:
         print("No speaker information available in the sheet.")
@@ -156,21 +202,29 @@ def main():
     Main function to prompt the user for input and call the appropriate function
     based on the user's choice (either all_user or speaker_info).
     """
+    parser = argparse.ArgumentParser(description="Symposium Information System")
+    parser.add_argument("--refresh", action="store_true", help="ignore the local cache and fetch the sheets again")
+    parser.add_argument("--offline", action="store_true", help="use the last cached copy of the sheets")
+    args = parser.parse_args()
+
     print("Welcome to the Symposium Information System!")
     print("Please choose an option:")
     print("1. Display all participants and speakers.")
     print("2. Display speaker information.")
+    print("3. Process new responses only.")
     
     # Asking the user for input
-    user_choice = input("Enter 1 or 2: ").strip()
+    user_choice = input("Enter 1, 2 or 3: ").strip()
 
     # Call the appropriate function based on user choice
     if user_choice == '1':
-        all_data()
+        all_data(refresh=args.refresh, offline=args.offline)
     elif user_choice == '2':
-        speaker_info()
+        speaker_info(refresh=args.refresh, offline=args.offline)
+    elif user_choice == '3':
+        new_registrations(refresh=args.refresh, offline=args.offline)
     else:
-        print("Invalid choice. Please enter 1 or 2.")
+        print("Invalid choice. Please enter 1, 2 or 3.")
 
 
 if __name__ == '__main__':
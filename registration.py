@@ -0,0 +1,393 @@
+# registration.py
+# Author: Indrajit Ghosh
+# Created On: Oct 17, 2026
+#
+# Typed records of the Symposium registration form responses.
+# The raw sheet rows are parsed once; every report works on the records.
+#
+
+import json
+import os
+import re
+import warnings
+from pathlib import Path
+
+STATE_DIR = Path(__file__).resolve().parent / '.cache'
+
+# Record field -> keywords identifying its column in the header row (lower case, whole words)
+HEADER_KEYWORDS = {
+    'timestamp': ('timestamp',),
+    'email': ('email', 'e-mail'),
+    'name': ('name',),
+    'affiliation': ('affiliation', 'position', 'designation'),
+    'wants_to_talk': ('talk',),
+    'wants_to_attend': ('attend',),
+}
+
+# Column positions used when the header row does not name a field
+DEFAULT_COLUMNS = {
+    'timestamp': 0,
+    'name': 1,
+    'email': 2,
+    'affiliation': 3,
+    'wants_to_talk': 4,
+    'wants_to_attend': 5,
+}
+
+YES = {'yes', 'y', 'true'}
+
+
+class Registration:
+    """
+    A single registration form response.
+
+    `affiliation` is kept as written in the form, `category` is its normalized
+    (stripped, lower case) form used for grouping, e.g. 'phd' or 'post doc'.
+    """
+    __slots__ = (
+        'row_number',
+        'timestamp',
+        'name',
+        'email',
+        'affiliation',
+        'category',
+        'wants_to_talk',
+        'wants_to_attend',
+    )
+
+    def __init__(self, row_number, timestamp, name, email, affiliation, wants_to_talk, wants_to_attend):
+        self.row_number = row_number
+        self.timestamp = timestamp
+        self.name = name
+        self.email = email
+        self.affiliation = affiliation
+        self.category = affiliation.lower()
+        self.wants_to_talk = wants_to_talk
+        self.wants_to_attend = wants_to_attend
+
+    def __repr__(self):
+        return "<{} row:{} {!r}>".format(self.__class__.__name__, self.row_number, self.name)
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__ if field != 'category'}
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(**d)
+
+    @property
+    def day(self):
+        """The registration date part of the form timestamp, e.g. '12/20/2024'"""
+        return self.timestamp.split(' ')[0]
+
+    def as_row(self):
+        """[timestamp, name, email, affiliation], as used in the printed tables"""
+        return [self.timestamp, self.name, self.email, self.affiliation]
+
+    def as_response_row(self):
+        """The full response with the booleans written out as 'Yes' / 'No'"""
+        return self.as_row() + [
+            'Yes' if self.wants_to_talk else 'No',
+            'Yes' if self.wants_to_attend else 'No',
+        ]
+
+
+def map_columns(header):
+    """
+    Maps the record fields to column positions from the header row.
+
+    A header names a field if it contains one of its `HEADER_KEYWORDS` as a whole
+    word ('talks' does not name 'wants_to_talk'). A header naming only one field
+    is preferred over one naming several; using the latter is warned about.
+
+    A field whose header is not recognised keeps its position in `DEFAULT_COLUMNS`,
+    unless another field already uses that column; it is then left unmapped
+    (`None`, read as an empty cell). Both cases are warned about.
+
+    :param header: The header row of the sheet.
+    :return: Dict of field name -> column index (or None).
+    """
+    columns = {}
+    taken = set()
+
+    # column index -> the fields its header names
+    named = {
+        index: {
+            field for field, keywords in HEADER_KEYWORDS.items()
+            if any(re.search(rf"\b{re.escape(keyword)}\b", title.strip().lower()) for keyword in keywords)
+        }
+        for index, title in enumerate(header)
+    }
+
+    for field in HEADER_KEYWORDS:
+        candidates = [index for index, fields in named.items() if field in fields and index not in taken]
+        if not candidates:
+            continue
+
+        index = min(candidates, key=lambda i: len(named[i])) # the leftmost of the least ambiguous
+        if len(named[index]) > 1:
+            warnings.warn(f"Header {header[index]!r} names several fields ({', '.join(sorted(named[index]))}); "
+                          f"it is used for {field!r}.")
+
+        columns[field] = index
+        taken.add(index)
+
+    for field, index in DEFAULT_COLUMNS.items():
+        if field in columns:
+            continue
+
+        if index in taken:
+            columns[field] = None
+            warnings.warn(f"No header column matches {field!r} and its default column {index} "
+                          f"is used by another field; {field!r} is left empty.")
+        else:
+            columns[field] = index
+            taken.add(index)
+            warnings.warn(f"No header column matches {field!r}; using the default column {index}.")
+
+    return columns
+
+
+def parse_registrations(data, header=True, first_row_number=2):
+    """
+    Parses the raw sheet values into `Registration` records.
+
+    Every field is stripped and the yes/no answers are turned into booleans
+    once, here. Short rows (the API drops trailing empty cells) are padded,
+    and completely empty rows are skipped.
+
+    :param data: List of lists representing the rows of the sheet.
+    :param header: If True, the first row is the header row used to map the columns.
+                   Otherwise it can be a header row (list) given separately, or False
+                   to use `DEFAULT_COLUMNS`.
+    :param first_row_number: Sheet row number of the first data row (for reference).
+    :return: List of `Registration` records.
+    """
+    if header is True:
+        header, data = (data[0], data[1:]) if data else ([], [])
+
+    columns = map_columns(header) if header else DEFAULT_COLUMNS
+    width = max(index for index in columns.values() if index is not None) + 1
+
+    records = []
+    for row_number, row in enumerate(data, start=first_row_number):
+        if not any(cell.strip() for cell in row):
+            continue
+
+        # an unmapped field (column None) reads the trailing '' cell
+        cells = [cell.strip() for cell in row] + [''] * (width + 1 - len(row))
+        field = {name: cells[-1 if index is None else index] for name, index in columns.items()}
+
+        records.append(Registration(
+            row_number=row_number,
+            timestamp=field['timestamp'],
+            name=field['name'],
+            email=field['email'],
+            affiliation=field['affiliation'],
+            wants_to_talk=field['wants_to_talk'].lower() in YES,
+            wants_to_attend=field['wants_to_attend'].lower() in YES,
+        ))
+
+    return records
+
+
+class ResponseStats:
+    """
+    Response statistics computed in a single pass over the registrations.
+
+    Besides the participant and speaker lists it keeps, for every field in
+    `group_by` (any `Registration` attribute, e.g. 'category' or 'day'),
+    the number of responses, speakers and participants per value. New form
+    rows are folded in with `add()` / `extend()` without rescanning the old ones.
+
+    Example:
+    --------
+        >>> stats = ResponseStats.from_registrations(parse_registrations(data))
+        >>> stats.groups['category']
+            {'phd': {'label': 'PhD', 'responses': 12, 'speakers': 5, 'participants': 11}, ...}
+        >>> stats.extend(parse_registrations(new_rows, header=header, first_row_number=40))
+    """
+
+    DEFAULT_GROUP_BY = ('category', 'day')
+
+    # Grouping field -> attribute shown as the group's label
+    LABELS = {'category': 'affiliation'}
+
+    def __init__(self, group_by=DEFAULT_GROUP_BY):
+
+        for field in group_by:
+            if not hasattr(Registration, field):
+                raise ValueError(f"Cannot group by {field!r}: not a `Registration` field.")
+
+        self.group_by = tuple(group_by)
+        self.responses = 0
+        self.participants = []
+        self.speakers = []
+        self.groups = {field: {} for field in self.group_by}
+
+
+    def __repr__(self):
+        return "<{} responses:{} participants:{} speakers:{}>".format(
+            self.__class__.__name__,
+            self.responses,
+            len(self.participants),
+            len(self.speakers),
+        )
+
+
+    @classmethod
+    def from_registrations(cls, registrations, group_by=DEFAULT_GROUP_BY):
+        stats = cls(group_by=group_by)
+        stats.extend(registrations)
+        return stats
+
+
+    def add(self, registration:Registration):
+        """Counts a single registration"""
+        self.responses += 1
+        if registration.wants_to_attend:
+            self.participants.append(registration)
+        if registration.wants_to_talk:
+            self.speakers.append(registration)
+
+        for field, groups in self.groups.items():
+            key = getattr(registration, field)
+            counts = groups.get(key)
+            if counts is None:
+                counts = groups[key] = {
+                    'label': getattr(registration, self.LABELS.get(field, field)),
+                    'responses': 0,
+                    'speakers': 0,
+                    'participants': 0,
+                }
+            counts['responses'] += 1
+            counts['speakers'] += registration.wants_to_talk
+            counts['participants'] += registration.wants_to_attend
+
+
+    def extend(self, registrations):
+        """Counts every registration of `registrations`"""
+        for registration in registrations:
+            self.add(registration)
+
+
+    def to_dict(self):
+        return {
+            'group_by': list(self.group_by),
+            'responses': self.responses,
+            'participants': [r.to_dict() for r in self.participants],
+            'speakers': [r.to_dict() for r in self.speakers],
+            'groups': self.groups,
+        }
+
+    @classmethod
+    def from_dict(cls, d):
+        stats = cls(group_by=d['group_by'])
+        stats.responses = d['responses']
+        stats.participants = [Registration.from_dict(r) for r in d['participants']]
+        stats.speakers = [Registration.from_dict(r) for r in d['speakers']]
+        stats.groups = d['groups']
+        return stats
+
+
+class RegistrationState:
+    """
+    The state of the incremental processing of a registration sheet.
+
+    It remembers the last processed sheet row (the watermark), the header row
+    and the `ResponseStats` so far, and is saved as JSON between runs. Each run
+    then only reads and counts the rows appended after the watermark.
+
+    N.B: Responses edited or deleted above the watermark are not seen; start
+    over with a fresh state (e.g. `python main.py --refresh`) after such edits.
+
+    Example:
+    --------
+        >>> state = RegistrationState.load(SYMPOSIUM_SHEET_ID)
+        >>> new = state.update(worksheet.iter_rows(start_row=state.next_row))
+        >>> state.save()
+    """
+
+    def __init__(self, spreadsheet_id, path=None):
+        self.spreadsheet_id = spreadsheet_id
+        self.path = Path(path) if path is not None else STATE_DIR / f"registrations_{spreadsheet_id}.json"
+        self.last_row = 0
+        self.header = None
+        self.stats = ResponseStats()
+
+    def __repr__(self):
+        return "<{} {!r} last_row:{}>".format(self.__class__.__name__, self.spreadsheet_id, self.last_row)
+
+    @property
+    def next_row(self):
+        """The first sheet row not processed yet"""
+        return self.last_row + 1
+
+
+    @classmethod
+    def load(cls, spreadsheet_id, path=None):
+        """
+        Loads the saved state of `spreadsheet_id`; a fresh state if there is none.
+        """
+        state = cls(spreadsheet_id, path=path)
+        try:
+            with open(state.path, 'r') as f:
+                d = json.load(f)
+        except (OSError, ValueError):
+            return state
+
+        state.last_row = d['last_row']
+        state.header = d['header']
+        state.stats = ResponseStats.from_dict(d['stats'])
+        return state
+
+
+    def save(self):
+        """Saves the state (atomically, so an interrupted run keeps the previous one)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(self.path.name + '.part')
+        with open(temp_path, 'w') as f:
+            json.dump({
+                'spreadsheet_id': self.spreadsheet_id,
+                'last_row': self.last_row,
+                'header': self.header,
+                'stats': self.stats.to_dict(),
+            }, f)
+        os.replace(temp_path, self.path)
+
+
+    def update(self, rows):
+        """
+        Processes the sheet rows starting at `next_row` and moves the watermark
+        past the last non-empty one.
+
+        :param rows: Iterable of the rows from `next_row` on, e.g.
+                     `worksheet.iter_rows(start_row=state.next_row)`.
+        :return: List of the new `Registration` records.
+        """
+        rows = list(rows)
+        first_row_number = self.next_row
+
+        if self.header is None:
+            if not rows:
+                return []
+            self.header, rows = rows[0], rows[1:]
+            self.last_row = first_row_number
+            first_row_number += 1
+
+        registrations = parse_registrations(rows, header=self.header, first_row_number=first_row_number)
+        self.stats.extend(registrations)
+
+        for row_number, row in enumerate(rows, start=first_row_number):
+            if any(cell.strip() for cell in row):
+                self.last_row = row_number
+
+        return registrations
+
+
+def main():
+    print('Registration records of the Symposium')
+
+
+if __name__ == '__main__':
+    main()
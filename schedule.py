@@ -2,10 +2,11 @@
 # Author: Indrajit Ghosh
 # Created On: Dec 24, 2024
 #
+import argparse
 import random
 
-from Google import *
-from main import get_participants_and_speakers, SYMPOSIUM_SHEET_ID
+from main import fetch_sheet_data, get_participants_and_speakers, SYMPOSIUM_SHEET_ID
+from registration import parse_registrations
 
 
 def create_schedule(speakers, total_days, max_talks_per_day, randomize=False):
@@ -16,8 +17,7 @@ def create_schedule(speakers, total_days, max_talks_per_day, randomize=False):
     has an equal or nearly equal number of talks, while respecting the maximum number of talks per day.
     Optionally, the schedule can be randomized.
 
-    :param speakers: List of speakers (list of lists) containing speaker details. 
-                      Each inner list represents a speaker with their information (e.g., name, talk title).
+    :param speakers: List of speakers (`Registration` records, see `registration.py`).
     :param total_days: The total number of days to schedule talks. 
                         The schedule will distribute talks evenly across these days.
     :param max_talks_per_day: The maximum number of talks allowed per day. 
@@ -67,17 +67,21 @@ def main():
 
     :return: None
     """
-    # Fetching data from Google Sheets
-    client = GoogleSheetClient()
-    spreadsheet = GoogleSheet(client=client, spreadsheet_id=SYMPOSIUM_SHEET_ID)
-    ws = spreadsheet.get_worksheet(0)
-    data = ws.get()
+    parser = argparse.ArgumentParser(description="Create the schedule of the Symposium talks")
+    parser.add_argument("--refresh", action="store_true", help="ignore the local cache and fetch the sheet again")
+    parser.add_argument("--offline", action="store_true", help="use the last cached copy of the sheet")
+    args = parser.parse_args()
+
+    # Fetching data from Google Sheets (or the local cache)
+    data = fetch_sheet_data(SYMPOSIUM_SHEET_ID, refresh=args.refresh, offline=args.offline)
+    if data is None:
+        return
 
     if not data or len(data) < 2:
         print("No data available in the sheet.")
         return
     
-    _, speakers = get_participants_and_speakers(data)
+    _, speakers = get_participants_and_speakers(parse_registrations(data))
     # Create a schedule
     schedule = create_schedule(speakers, total_days=3, max_talks_per_day=5, randomize=False)
 
@@ -85,7 +89,7 @@ def main():
     for day, talks in enumerate(schedule, start=1):
         print(f"Day {day}:")
         for talk in talks:
-            print(f"  - {talk[1]} ({talk[3]})")
+            print(f"  - {talk.name} ({talk.affiliation})")
         print("\n")
 
 if __name__ == "__main__":